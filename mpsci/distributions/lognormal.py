@@ -7,6 +7,7 @@ of the underlying normal distribution.  These are not the same
 parameters as used in `scipy.stats.lognorm`.
 """
 
+from functools import lru_cache
 from mpmath import mp
 from ._common import _validate_p, _validate_moment_n, _validate_x_bounds
 
@@ -24,6 +25,20 @@ def _validate_params(mu, sigma):
     return mp.mpf(mu), mp.mpf(sigma)
 
 
+# The precision is an argument of the following cached functions so it
+# is part of the cache key.
+
+@lru_cache()
+def _half_log_2pi(prec):
+    return mp.log(2*mp.pi)/2
+
+
+@lru_cache()
+def _expm1_sigma2(sigma, prec):
+    # sigma must already be validated.
+    return mp.expm1(sigma**2)
+
+
 def pdf(x, mu=0, sigma=1):
     """
     Log-normal distribution probability density function.
@@ -47,9 +62,8 @@ def logpdf(x, mu=0, sigma=1):
         if x <= 0:
             return -mp.inf
         lnx = mp.log(x)
-        t = -(lnx - mu)**2 / (2*sigma**2)
-        return (-mp.log(x) - mp.log(sigma)
-                - 0.5*mp.log(2*mp.pi) + t)
+        return (-lnx - mp.log(sigma) - _half_log_2pi(mp.prec)
+                - (lnx - mu)**2 / (2*sigma**2))
 
 
 def cdf(x, mu=0, sigma=1):
@@ -61,8 +75,8 @@ def cdf(x, mu=0, sigma=1):
         x = mp.mpf(x)
         if x <= 0:
             return mp.zero
-        lnx = mp.log(x)
-        return mp.ncdf(lnx, mu, sigma)
+        z = (mp.log(x) - mu)/(sigma*mp.sqrt(2))
+        return mp.erfc(-z)/2
 
 
 def sf(x, mu=0, sigma=1):
@@ -73,9 +87,48 @@ def sf(x, mu=0, sigma=1):
         mu, sigma = _validate_params(mu, sigma)
         x = mp.mpf(x)
         if x <= 0:
-            return mp.mp.one
-        lnx = mp.log(x)
-        return mp.ncdf(-lnx, -mu, sigma)
+            return mp.one
+        z = (mp.log(x) - mu)/(sigma*mp.sqrt(2))
+        return mp.erfc(z)/2
+
+
+def _erfinv_fast(y):
+    """
+    Inverse of the error function.
+
+    The initial guess is Winitzki's approximation, which has a relative
+    error of roughly 2e-3.  It is refined with Halley's method.  Because
+    the convergence is cubic, just a few steps are needed, even at high
+    precision.  When abs(y) > 1/2, the residual is computed with erfc
+    to avoid the loss of precision in erf(x) - y.
+    """
+    y = mp.mpf(y)
+    if y == 0:
+        return y
+    if abs(y) == 1:
+        return mp.sign(y)*mp.inf
+    a = mp.mpf(0.147)
+    ln = mp.log((1 - y)*(1 + y))
+    t = 2/(mp.pi*a) + ln/2
+    x = mp.sign(y)*mp.sqrt(mp.sqrt(t*t - ln/a) - t)
+    # c is the derivative of erf at 0.
+    c = 2/mp.sqrt(mp.pi)
+    tol = 4*mp.eps
+    for _ in range(25):
+        if y > 0.5:
+            r = (1 - y) - mp.erfc(x)
+        elif y < -0.5:
+            r = mp.erfc(-x) - (1 + y)
+        else:
+            r = mp.erf(x) - y
+        # u is the Newton step r/erf'(x).  The second derivative of erf
+        # is -2*x*erf'(x), so the Halley step is u/(1 + x*u).
+        u = r/(c*mp.exp(-x*x))
+        step = u/(1 + x*u)
+        x -= step
+        if abs(step) <= tol*abs(x):
+            break
+    return x
 
 
 def invcdf(p, mu=0, sigma=1):
@@ -88,7 +141,7 @@ def invcdf(p, mu=0, sigma=1):
     with mp.extradps(5):
         p = _validate_p(p)
         mu, sigma = _validate_params(mu, sigma)
-        a = mp.erfinv(2*p - 1)
+        a = _erfinv_fast(2*p - 1)
         x = mp.exp(mp.sqrt(2)*sigma*a + mu)
         return x
 
@@ -100,7 +153,9 @@ def invsf(p, mu=0, sigma=1):
     with mp.extradps(5):
         p = _validate_p(p)
         mu, sigma = _validate_params(mu, sigma)
-        return invcdf(1 - p, mu, sigma)
+        a = _erfinv_fast(1 - 2*p)
+        x = mp.exp(mp.sqrt(2)*sigma*a + mu)
+        return x
 
 
 def support(mu=0, sigma=1):
@@ -127,8 +182,7 @@ def var(mu=0, sigma=1):
     """
     with mp.extradps(5):
         mu, sigma = _validate_params(mu, sigma)
-        sigma2 = sigma**2
-        return mp.expm1(sigma2) * mp.exp(2*mu + sigma2)
+        return _expm1_sigma2(sigma, mp.prec) * mp.exp(2*mu + sigma**2)
 
 
 def skewness(mu=0, sigma=1):
@@ -137,8 +191,8 @@ def skewness(mu=0, sigma=1):
     """
     with mp.extradps(5):
         mu, sigma = _validate_params(mu, sigma)
-        sigma2 = sigma**2
-        return (mp.exp(sigma2) + 2) * mp.sqrt(mp.expm1(sigma2))
+        m = _expm1_sigma2(sigma, mp.prec)
+        return (m + 3) * mp.sqrt(m)
 
 
 def kurtosis(mu=0, sigma=1):
@@ -147,9 +201,13 @@ def kurtosis(mu=0, sigma=1):
     """
     with mp.extradps(5):
         mu, sigma = _validate_params(mu, sigma)
-        sigma2 = sigma**2
-        return (mp.exp(4*sigma2) + 2*mp.exp(3*sigma2)
-                + 3*mp.exp(2*sigma2) - 6)
+        # With m = expm1(sigma**2), the usual formula
+        #     exp(4*sigma**2) + 2*exp(3*sigma**2) + 3*exp(2*sigma**2) - 6
+        # is 16*m + 15*m**2 + 6*m**3 + m**4.  This requires just one
+        # exponential, and it avoids the loss of precision in the usual
+        # formula when sigma is small.
+        m = _expm1_sigma2(sigma, mp.prec)
+        return m*(16 + m*(15 + m*(6 + m)))
 
 
 def entropy(mu=0, sigma=1):
@@ -158,7 +216,7 @@ def entropy(mu=0, sigma=1):
     """
     with mp.extradps(5):
         mu, sigma = _validate_params(mu, sigma)
-        return mp.log(sigma) + mu + 0.5 + 0.5*mp.log(2*mp.pi)
+        return mp.log(sigma) + mu + 0.5 + _half_log_2pi(mp.prec)
 
 
 def noncentral_moment(n, mu=0, sigma=1):
@@ -184,6 +242,21 @@ def nll(x, mu, sigma):
         return -mp.fsum([logpdf(xi, mu, sigma) for xi in x])
 
 
+def _iter_positive(x):
+    """
+    Iterate over the values in x, converting them to mpmath numbers.
+
+    This is the single-pass equivalent of
+    ``_validate_x_bounds(x, low=0, strict_low=True)``; ValueError is
+    raised when a value that is not positive is reached.
+    """
+    for t in x:
+        t = mp.mpmathify(t)
+        if t <= 0:
+            raise ValueError('All values in x must be greater than 0.')
+        yield t
+
+
 # XXX Add standard errors and confidence intervals for the fitted parameters.
 
 
@@ -196,12 +269,15 @@ def mle(x):
     Returns (mu, sigma).
     """
     with mp.extradps(5):
-        x = _validate_x_bounds(x, low=0, strict_low=True)
-        lnx = [mp.log(t) for t in x]
-        N = len(x)
-        meanx = sum(lnx) / N
-        var = sum((lnxi - meanx)**2 for lnxi in lnx) / N
-        sigma = mp.sqrt(var)
+        # Welford's one-pass algorithm for the mean and variance of log(x).
+        meanx = mp.zero
+        m2 = mp.zero
+        for n, t in enumerate(_iter_positive(x), start=1):
+            lnt = mp.log(t)
+            delta = lnt - meanx
+            meanx += delta/n
+            m2 += delta*(lnt - meanx)
+        sigma = mp.sqrt(m2/len(x))
         return meanx, sigma
 
 
@@ -214,9 +290,9 @@ def mom(x):
     Returns (mu, sigma).
     """
     with mp.extradps(5):
-        x = _validate_x_bounds(x, low=0, strict_low=True)
+        x = list(_iter_positive(x))
         logsumx = mp.log(mp.fsum(x))
-        logsumx2 = mp.log(mp.fsum([mp.mpf(t)**2 for t in x]))
+        logsumx2 = mp.log(mp.fsum(x, squared=True))
         logn = mp.log(len(x))
         mu = -logsumx2/2 + 2*logsumx - 3*logn/2
         sigma = mp.sqrt(logsumx2 - 2*logsumx + logn)
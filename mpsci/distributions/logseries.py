@@ -9,6 +9,7 @@ distribution [1]_.
        https://en.wikipedia.org/wiki/Logarithmic_distribution
 """
 
+from functools import lru_cache
 import itertools
 from mpmath import mp
 from mpsci.stats import mean as _fmean
@@ -39,48 +40,101 @@ def support(p):
     return itertools.count(start=1)
 
 
+# log1p(-p) is needed by most of the functions in this module.  The
+# precision is an argument so it is part of the cache key.
+@lru_cache()
+def _log1p_neg(p, prec):
+    # p must already be validated.
+    return mp.log1p(-p)
+
+
+def _logpmf(k, p):
+    # p must already be validated.
+    return k*mp.log(p) - mp.log(k) - mp.log(-_log1p_neg(p, mp.prec))
+
+
 def pmf(k, p):
     """
     Probability mass function of the log-series distribution.
     """
+    if k < 1:
+        # The early exit does not need the extra precision, but p is
+        # still validated.
+        _validate_p(p)
+        return mp.zero
     with mp.extradps(5):
         p = _validate_p(p)
-        if k < 1:
-            return mp.zero
-        return mp.exp(logpmf(k, p))
+        # This is exp(logpmf(k, p)), but p**k is cheaper than the
+        # log and exp calls.
+        return -p**k / (k*_log1p_neg(p, mp.prec))
 
 
 def logpmf(k, p):
     """
     Natural log of the PMF of the log-series distribution.
     """
+    if k < 1:
+        _validate_p(p)
+        return mp.ninf
     with mp.extradps(5):
         p = _validate_p(p)
-        if k < 1:
-            return mp.ninf
-        return k*mp.log(p) - mp.log(k) - mp.log(-mp.log1p(-p))
+        return _logpmf(k, p)
+
+
+# For k up to this value, cdf and sf are computed with the direct sum
+# of the PMF instead of the incomplete beta function.
+_DIRECT_SUM_MAX_K = 200
+
+
+def _partial_sum(k, p):
+    """
+    Compute sum(p**j/j for j in range(1, k + 1)).
+
+    k must be a nonnegative integer.
+    """
+    terms = []
+    pj = mp.one
+    for j in range(1, k + 1):
+        pj *= p
+        terms.append(pj/j)
+    return mp.fsum(terms)
 
 
 def cdf(k, p):
     """
     CDF of the log-series distribution.
     """
+    if k < 1:
+        _validate_p(p)
+        return mp.zero
     with mp.extradps(5):
         p = _validate_p(p)
-        if k < 1:
-            return mp.zero
-        return 1 + mp.betainc(k + 1, 0, 0, p) / mp.log1p(-p)
+        if mp.isint(k) and k <= _DIRECT_SUM_MAX_K:
+            # There is no subtractive cancellation in this formula, so the
+            # direct sum is used for any p.
+            return -_partial_sum(int(k), p) / _log1p_neg(p, mp.prec)
+        return 1 + mp.betainc(k + 1, 0, 0, p) / _log1p_neg(p, mp.prec)
 
 
 def sf(k, p):
     """
     Survival function of the log-series distribution.
     """
+    if k < 1:
+        _validate_p(p)
+        return mp.one
     with mp.extradps(5):
         p = _validate_p(p)
-        if k < 1:
-            return mp.one
-        return -mp.betainc(k + 1, 0, 0, p) / mp.log1p(-p)
+        if mp.isint(k) and k <= _DIRECT_SUM_MAX_K and p >= 0.5:
+            # The direct sum is subtracted from -log1p(-p), so there is
+            # cancellation.  With p >= 1/2, the result is not less than
+            # 2**-(k+1)/(k+1)/-log1p(-p), so k extra bits, plus a margin
+            # for the other factors, are enough.  For smaller p, the
+            # incomplete beta function is fast and there is no cancellation.
+            with mp.extraprec(int(k) + 24):
+                r = _log1p_neg(p, mp.prec)
+                return 1 + _partial_sum(int(k), p) / r
+        return -mp.betainc(k + 1, 0, 0, p) / _log1p_neg(p, mp.prec)
 
 
 def mean(p):
@@ -89,7 +143,7 @@ def mean(p):
     """
     with mp.extradps(5):
         p = _validate_p(p)
-        return p / (p - 1) / mp.log1p(-p)
+        return p / (p - 1) / _log1p_neg(p, mp.prec)
 
 
 def var(p):
@@ -98,7 +152,7 @@ def var(p):
     """
     with mp.extradps(5):
         p = _validate_p(p)
-        l1p = mp.log1p(-p)
+        l1p = _log1p_neg(p, mp.prec)
         return -(p*(p + l1p)) / (1 - p)**2 / l1p**2
 
 
@@ -116,7 +170,7 @@ def skewness(p):
     """
     with mp.extradps(5):
         p = _validate_p(p)
-        r = mp.log1p(-p)
+        r = _log1p_neg(p, mp.prec)
         s = p + r
         num = p*(2*p + 3*r) + (1 + p)*r**2
         den = -mp.sqrt(-p*s)*s
@@ -129,7 +183,7 @@ def kurtosis(p):
     """
     with mp.extradps(5):
         p = _validate_p(p)
-        r = mp.log1p(-p)
+        r = _log1p_neg(p, mp.prec)
         r2 = r*r
         r3 = r2*r
         num = p*(p*(-6*p + r*(r*(-r - 4) - 12)) + r2*(-4*r - 7)) - r3
@@ -146,16 +200,31 @@ def nll(x, p, *, counts=None):
     if not all([mp.isint(t) and t >= 1 for t in x]):
         raise ValueError('all values in x must be integers greater than 0')
     counts = _validate_counts(x, counts, expand_none=True)
-    return -mp.fsum([count*logpmf(t, p)
-                     for t, count in zip(x, counts)])
+    # logpmf(k, p) is k*log(p) - log(k) - log(-log1p(-p)); the terms that
+    # depend only on p are computed once.
+    logp = mp.log(p)
+    c = mp.log(-_log1p_neg(p, mp.prec))
+    return (-mp.fsum([count*(t*logp - mp.log(t))
+                      for t, count in zip(x, counts)])
+            + sum(counts)*c)
+
+
+def _lambertw_m1_low_prec(x):
+    # The initial guess for Newton's method in mle does not have to be
+    # accurate to the full working precision, so the branch -1 of the
+    # Lambert W function is evaluated with double precision.  (The caller
+    # still forms 1 + 1/(m*w) at the working precision, so the result is
+    # not rounded to 1 when p is extremely close to 1.)
+    with mp.workdps(15):
+        return mp.lambertw(x, k=-1).real
 
 
 def _approx_inv_mle_func(m):
     # For m sufficiently large (i.e. p close to 1).
-    pa = 1 + 1/(m*mp.lambertw(-1/m, k=-1).real)
+    pa = 1 + 1/(m*_lambertw_m1_low_prec(-1/m))
     m = m/pa
     # This correction usually improves the approximation.
-    pa2 = 1 + 1/(m*mp.lambertw(-1/m, k=-1).real)
+    pa2 = 1 + 1/(m*_lambertw_m1_low_prec(-1/m))
     if pa2 < 1:
         return pa2
     return pa
@@ -165,6 +234,11 @@ def _mle_func(p):
     return -p/((1 - p)*mp.log1p(-p))
 
 
+def _mle_func_deriv(p):
+    r = mp.log1p(-p)
+    return -(p + r)/((1 - p)*r)**2
+
+
 @mp.extradps(5)
 def mle(x, *, counts=None):
     """
@@ -193,7 +267,7 @@ def mle(x, *, counts=None):
         if m > mp.e:
             pa = _approx_inv_mle_func(m)
             p = mp.findroot(lambda t: _mle_func(t) - m, pa,
-                            method='newton').real
+                            solver='newton', df=_mle_func_deriv).real
             return p
         else:
             # pnumer must satisfy _mle_func(pnumer) < e.
@@ -203,6 +277,12 @@ def mle(x, *, counts=None):
             # pmax must satisfy _mle_func(pmax) > e.
             pmax = 0.8264
             high = min(2*(m - 1), pmax)
-            p = mp.findroot(lambda t: _mle_func(t) - m, [low, high],
-                            method='ridder')
+            # [low, high] brackets the root, so a bracketing solver is used.
+            # (findroot ignores the keyword 'method' that was used here
+            # previously, so the default secant solver was being used.)
+            # Of the bracketing solvers in mpmath, the Anderson-Bjorck
+            # variant of regula falsi requires the fewest evaluations of
+            # _mle_func for this function.
+            p = mp.findroot(lambda t: _mle_func(t) - m, (low, high),
+                            solver='anderson')
             return p
@@ -14,8 +14,9 @@ The parametrization used here matches that of SciPy.
 
 """
 
+from functools import lru_cache
 from mpmath import mp
-from ._common import _validate_p, _find_bracket
+from ._common import _validate_p
 
 
 __all__ = ['pdf', 'logpdf', 'cdf', 'invcdf', 'sf', 'invsf',
@@ -28,6 +29,37 @@ def _validate_params(loc=0, scale=1):
     return mp.mpf(loc), mp.mpf(scale)
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _sqrt_2_over_pi(prec):
+    return mp.sqrt(2/mp.pi)
+
+
+def _p_3_2(t):
+    """
+    Regularized lower incomplete gamma function P(3/2, t).
+
+    For a = 3/2, P(a, t) = erf(sqrt(t)) - 2*sqrt(t/pi)*exp(-t), which is
+    much faster to evaluate than the general incomplete gamma function.
+    For small t there is subtractive cancellation in that formula, so
+    mp.gammainc is used.
+    """
+    if t < 0.25:
+        return mp.gammainc(1.5, 0, t, regularized=True)
+    r = mp.sqrt(t)
+    return mp.erf(r) - 2*r*mp.exp(-t)/mp.sqrt(mp.pi)
+
+
+def _q_3_2(t):
+    """
+    Regularized upper incomplete gamma function Q(3/2, t).
+
+    For a = 3/2, Q(a, t) = erfc(sqrt(t)) + 2*sqrt(t/pi)*exp(-t).
+    """
+    r = mp.sqrt(t)
+    return mp.erfc(r) + 2*r*mp.exp(-t)/mp.sqrt(mp.pi)
+
+
 def pdf(x, loc=0, scale=1):
     """
     Probability density function for the Maxwell distribution.
@@ -39,7 +71,7 @@ def pdf(x, loc=0, scale=1):
         x = mp.mpf(x)
         z = (x - loc)/scale
         z2 = z**2
-        return mp.sqrt(2/mp.pi)*z2*mp.exp(-z2/2)/scale
+        return _sqrt_2_over_pi(mp.prec)*z2*mp.exp(-z2/2)/scale
 
 
 def logpdf(x, loc=0, scale=1):
@@ -65,7 +97,67 @@ def cdf(x, loc=0, scale=1):
             return mp.zero
         x = mp.mpf(x)
         z = (x - loc)/scale
-        return mp.gammainc(3/2, 0, z**2/2, regularized=True)
+        return _p_3_2(z**2/2)
+
+
+def _invgammainc_3_2(p, upper=False):
+    """
+    Solve P(3/2, t) = p (or Q(3/2, t) = p if `upper` is True) for t.
+
+    P and Q are the regularized lower and upper incomplete gamma functions.
+    To avoid the ill-conditioning of the problem when p is close to 1, the
+    complementary problem is solved when p > 1/2.
+
+    The initial guess is the larger of the Wilson-Hilferty approximation
+    and the leading term of the expansion of P (or Q) in the tail.  The
+    root is refined with Newton's method applied to
+    log(P(3/2, exp(s))) - log(p) (lower tail) or log(Q(3/2, t)) - log(p)
+    (upper tail).  Both functions are nearly linear in the tail where they
+    are used, so only a few iterations are required.
+    """
+    if p > 0.5:
+        p = 1 - p
+        upper = not upper
+    a = mp.mpf(1.5)
+    # Initial guess.
+    if upper:
+        zp = mp.sqrt(2)*mp.erfinv(1 - 2*p)
+        # Leading term of the asymptotic expansion of Q for large t.
+        t0 = -mp.log(p*mp.sqrt(mp.pi)/2)
+        t0 = max(t0 + mp.log(t0)/2, t0)
+    else:
+        zp = mp.sqrt(2)*mp.erfinv(2*p - 1)
+        # Leading term of the series of P for small t.
+        t0 = (3*mp.sqrt(mp.pi)*p/4)**(mp.mpf(2)/3)
+    c = 1/(9*a)
+    w = 1 - c + zp*mp.sqrt(c)
+    if w > 0 and mp.isfinite(w):
+        # Wilson-Hilferty approximation.
+        t0 = max(t0, a*w**3)
+
+    # c0 is 1/Gamma(3/2).  The derivative of P(3/2, t) is c0*sqrt(t)*exp(-t).
+    c0 = 2/mp.sqrt(mp.pi)
+    logp = mp.log(p)
+    if upper:
+        def func(t):
+            return mp.log(_q_3_2(t)) - logp
+
+        def deriv(t):
+            q = _q_3_2(t)
+            return -c0*mp.sqrt(t)*mp.exp(-t)/q
+
+        return mp.findroot(func, t0, solver='newton', df=deriv)
+    else:
+        def func(s):
+            return mp.log(_p_3_2(mp.exp(s))) - logp
+
+        def deriv(s):
+            t = mp.exp(s)
+            q = _p_3_2(t)
+            return c0*t*mp.sqrt(t)*mp.exp(-t)/q
+
+        return mp.exp(mp.findroot(func, mp.log(t0), solver='newton',
+                                  df=deriv))
 
 
 def invcdf(p, loc=0, scale=1):
@@ -74,27 +166,19 @@ def invcdf(p, loc=0, scale=1):
 
     This function is also known as the quantile function.
 
-    The function is implemented by numerically inverting the CDF
-    using the mpmath ``findroot`` function.  It may fail for
-    extremely small values of ``p``.
+    The CDF is P(3/2, z**2/2), where P is the regularized lower incomplete
+    gamma function and z = (x - loc)/scale.  The function is implemented
+    by inverting P with Newton's method.
     """
     with mp.extradps(5):
         p = _validate_p(p)
         loc, scale = _validate_params(loc, scale)
         if p == 0:
-            return mp.zero
+            return loc
         if p == 1:
             return mp.inf
-        x0, x1 = _find_bracket(lambda x: cdf(x, loc, scale), p, 0, mp.inf)
-        if x0 == x1:
-            return x0
-        try:
-            x = mp.findroot(lambda x: cdf(x, loc, scale) - p, x0=(x0, x1),
-                            solver='secant')
-        except Exception:
-            x = mp.findroot(lambda x: cdf(x, loc, scale) - p, x0=(x0 + x1)/2,
-                            solver='newton')
-        return x
+        t = _invgammainc_3_2(p)
+        return loc + scale*mp.sqrt(2*t)
 
 
 def sf(x, loc=0, scale=1):
@@ -107,16 +191,16 @@ def sf(x, loc=0, scale=1):
             return mp.one
         x = mp.mpf(x)
         z = (x - loc)/scale
-        return mp.gammainc(3/2, z**2/2, mp.inf, regularized=True)
+        return _q_3_2(z**2/2)
 
 
 def invsf(p, loc=0, scale=1):
     """
     Inverse of the survival function of the Maxwell distribution.
 
-    The function is implemented by numerically inverting the
-    survival function using the mpmath ``findroot`` function.
-    It may fail for values of ``p`` very close to 1.
+    The survival function is Q(3/2, z**2/2), where Q is the regularized
+    upper incomplete gamma function and z = (x - loc)/scale.  The function
+    is implemented by inverting Q with Newton's method.
     """
     with mp.extradps(5):
         p = _validate_p(p)
@@ -124,17 +208,9 @@ def invsf(p, loc=0, scale=1):
         if p == 0:
             return mp.inf
         if p == 1:
-            return mp.zero
-        x0, x1 = _find_bracket(lambda x: sf(x, loc, scale), p, 0, mp.inf)
-        if x0 == x1:
-            return x0
-        try:
-            x = mp.findroot(lambda x: sf(x, loc, scale) - p, x0=(x0, x1),
-                            solver='secant')
-        except Exception:
-            x = mp.findroot(lambda x: cdf(x, loc, scale) - p, x0=(x0 + x1)/2,
-                            solver='newton')
-        return x
+            return loc
+        t = _invgammainc_3_2(p, upper=True)
+        return loc + scale*mp.sqrt(2*t)
 
 
 def support(loc=0, scale=1):
@@ -152,7 +228,7 @@ def mean(loc=0, scale=1):
     """
     with mp.extradps(5):
         loc, scale = _validate_params(loc, scale)
-        return loc + scale*2*mp.sqrt(2/mp.pi)
+        return loc + scale*2*_sqrt_2_over_pi(mp.prec)
 
 
 def mode(loc=0, scale=1):
@@ -6,6 +6,7 @@ The multivariate hypergeometric distribution is a generalization of the
 hypergeometric distribution.
 """
 
+from functools import lru_cache
 from mpmath import mp
 from ..fun import logbinomial
 
@@ -21,6 +22,12 @@ def _validate_params(colors, nsample):
         raise ValueError("nsample must not exceed sum(colors).")
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache(maxsize=4096)
+def _logbinomial(n, k, prec):
+    return logbinomial(n, k)
+
+
 def support(colors, nsample):
     """
     Generator of the support of the multivariate hypergeometric distribution.
@@ -58,15 +65,57 @@ def support(colors, nsample):
 
 
 def _support_gen(colors, nsample):
-    if len(colors) == 1:
-        yield [nsample]
-    else:
-        c0 = colors[0]
-        c1 = sum(colors[1:])
-        first = max(nsample - c1, 0)
-        last = min(c0, nsample)
-        for k in range(first, last + 1):
-            yield from [[k] + t for t in _support_gen(colors[1:], nsample - k)]
+    for x, _ in _support_iter(colors, nsample):
+        yield x
+
+
+def _support_iter(colors, nsample, table=None):
+    # Iterative generator of the support.  The points are generated in
+    # lexicographic order.  coords holds the current point, and last[i] is
+    # the largest value that coords[i] can have, given the values in
+    # coords[:i].  suffix[i] is sum(colors[i:]).
+    #
+    # If table is not None, table[i][k] must be a number associated with
+    # coords[i] == k, and the generator yields (point, total), where total
+    # is the sum of table[i][point[i]].  Consecutive points usually share
+    # a long prefix, so the partial sums psum[i] of the first i terms are
+    # maintained and only updated for the coordinates that change.
+    # If table is None, the generator yields (point, None).
+    n = len(colors)
+    suffix = [0]*(n + 1)
+    for i in range(n - 1, -1, -1):
+        suffix[i] = suffix[i + 1] + colors[i]
+    coords = [0]*n
+    last = [0]*n
+    psum = [0]*n
+    remaining = nsample
+    start = 0
+    while True:
+        # Set coords[start:n-1] to their smallest possible values.
+        for i in range(start, n - 1):
+            coords[i] = max(remaining - suffix[i + 1], 0)
+            last[i] = min(colors[i], remaining)
+            remaining -= coords[i]
+            if table is not None:
+                psum[i + 1] = psum[i] + table[i][coords[i]]
+        coords[n - 1] = remaining
+        if table is not None:
+            yield coords.copy(), psum[n - 1] + table[n - 1][remaining]
+        else:
+            yield coords.copy(), None
+        # Find the rightmost coordinate (excluding the last one) that
+        # can be incremented.
+        i = n - 2
+        while i >= 0 and coords[i] == last[i]:
+            remaining += coords[i]
+            i -= 1
+        if i < 0:
+            return
+        coords[i] += 1
+        remaining -= 1
+        if table is not None:
+            psum[i + 1] = psum[i] + table[i][coords[i]]
+        start = i + 1
 
 
 def logpmf(point, colors, nsample):
@@ -85,14 +134,31 @@ def logpmf(point, colors, nsample):
     _validate_params(colors, nsample)
     with mp.extradps(5):
         total = sum(colors)
-        logdenom = logbinomial(total, nsample)
+        logdenom = _logbinomial(total, nsample, mp.prec)
         lognumer = 0
         for color, k in zip(colors, point):
-            lognumer += logbinomial(color, k)
+            lognumer += _logbinomial(color, k, mp.prec)
         logp = lognumer - logdenom
         return logp
 
 
+def _logpmf_iter(colors, nsample):
+    """
+    Generate (point, logpmf(point)) for each point in the support.
+
+    The parameters must already be validated.
+    """
+    prec = mp.prec
+    logdenom = _logbinomial(sum(colors), nsample, prec)
+    # The values of logbinomial(color, k) that can occur in the terms
+    # of the log of the PMF are stored in a table.
+    table = [[_logbinomial(color, k, prec)
+              for k in range(min(color, nsample) + 1)]
+             for color in colors]
+    for x, lognumer in _support_iter(colors, nsample, table):
+        yield x, lognumer - logdenom
+
+
 def pmf(point, colors, nsample):
     """
     Probability mass function of the multivariate hypergeometric distribution.
@@ -201,13 +267,14 @@ def cov(colors, nsample):
             return [[mp.zero]*n for _ in range(n)]
         u = [k / s for k in colors]
         f = nsample * (s - nsample) / (s - 1)
+        fu = [f * ui for ui in u]
         c = [[None]*n for _ in range(n)]
         for i in range(n):
-            for j in range(n):
-                if i == j:
-                    c[i][j] = f * u[i] * (1 - u[i])
-                else:
-                    c[i][j] = -f * u[i] * u[j]
+            c[i][i] = fu[i] * (1 - u[i])
+            # The matrix is symmetric; compute the upper triangle and copy
+            # the values to the lower triangle.
+            for j in range(i + 1, n):
+                c[i][j] = c[j][i] = -fu[i] * u[j]
         return c
 
 
@@ -235,8 +302,5 @@ def entropy(colors, nsample):
     """
     _validate_params(colors, nsample)
     with mp.extradps(5):
-        terms = []
-        for x in _support_gen(colors, nsample):
-            logp = logpmf(x, colors, nsample)
-            terms.append(mp.exp(logp) * logp)
-        return -mp.fsum(terms)
+        return -mp.fsum([mp.exp(logp) * logp
+                         for _, logp in _logpmf_iter(colors, nsample)])
@@ -16,6 +16,7 @@ Multivariate t Distribution
 #     ≈ 0.0280719251273608075819567901706183442574259902571887726816304...
 
 
+from functools import lru_cache
 from mpmath import mp
 
 
@@ -24,6 +25,52 @@ __all__ = ['logpdf', 'pdf', 'entropy']
 _multivariate = True
 
 
+# In the cached functions, the precision is an argument so it is part of
+# the cache key.  A matrix is passed as the tuple of its
+# entries (in row-major order) and its number of rows, because
+# mpmath matrices are not hashable.
+
+def _matrix_from_entries(entries, n):
+    a = mp.matrix(n, n)
+    for k, v in enumerate(entries):
+        a[k // n, k % n] = v
+    return a
+
+
+@lru_cache()
+def _cholesky(scale_entries, n, prec):
+    # Returns the lower triangular Cholesky factor L of scale as a tuple of
+    # rows, where row i holds L[i, 0], ..., L[i, i].
+    with mp.extradps(5):
+        L = mp.cholesky(_matrix_from_entries(scale_entries, n))
+        return tuple(tuple(L[i, j] for j in range(i + 1)) for i in range(n))
+
+
+@lru_cache()
+def _half_logdet(scale_entries, n, prec):
+    # log(det(scale))/2 is the sum of the logs of the diagonal of the
+    # Cholesky factor.
+    L = _cholesky(scale_entries, n, prec)
+    return mp.fsum([mp.log(row[-1]) for row in L])
+
+
+def _forward_solve(L, b):
+    # Solve L*y = b, where L is a lower triangular matrix stored as
+    # returned by _cholesky.
+    y = []
+    for row, bi in zip(L, b):
+        y.append((bi - mp.fsum([lij*yj for lij, yj in zip(row, y)]))
+                 / row[-1])
+    return y
+
+
+@lru_cache()
+def _logpdf_const(nu, p, prec):
+    # The terms of logpdf that depend only on nu and p.
+    c = (nu + p)/2
+    return mp.loggamma(c) - mp.loggamma(nu/2) - (p/2)*mp.log(nu*mp.pi)
+
+
 def logpdf(x, nu, loc, scale, scale_inv=None):
     """
     Natural logarithm of the PDF for the multivariate t distribution.
@@ -33,33 +80,38 @@ def logpdf(x, nu, loc, scale, scale_inv=None):
     positive definite.
 
     If given, `scale_inv` must be the inverse of `scale`.
+
+    The Cholesky factorization of `scale` is used to compute its
+    determinant and the quadratic form in the PDF.  The factorization is
+    cached, so repeated calls with the same `scale` (e.g. when evaluating
+    the PDF at many points) do not recompute it.
     """
 
-    p = mp.mpf(len(loc))
+    n = scale.rows
+    if len(loc) != n:
+        raise ValueError('len(loc) must equal the number of rows of scale')
+    if len(x) != n:
+        raise ValueError('len(x) must equal the number of rows of scale')
+    p = mp.mpf(n)
     with mp.extradps(5):
         nu = mp.mpf(nu)
-        if scale_inv is None:
-            with mp.extradps(5):
-                scale_inv = mp.inverse(scale)
-        tmp = mp.matrix(scale.cols, 1)
-        for k, v in enumerate(loc):
-            tmp[k] = mp.mpf(v)
-        loc = tmp
-        tmp = mp.matrix(scale.cols, 1)
-        for k, v in enumerate(x):
-            tmp[k] = mp.mpf(v)
-        x = tmp
-        delta = x - loc
+        scale_entries = tuple(scale[i, j] for i in range(n) for j in range(n))
+        delta = [mp.mpf(xi) - mp.mpf(li) for xi, li in zip(x, loc)]
         c = (nu + p)/2
-        t1 = -c * mp.log1p((delta.T * scale_inv * delta)[0, 0] / nu)
-        t2 = mp.loggamma(c)
-        t3 = mp.loggamma(nu/2)
-        t4 = (p/2)*mp.log(nu)
-        t5 = (p/2)*mp.log(mp.pi)
-        with mp.extradps(5):
-            det = mp.det(scale)
-        t6 = mp.log(det)/2
-        return t2 - t3 - t4 - t5 - t6 + t1
+        # Quadratic form delta.T * inverse(scale) * delta.
+        if scale_inv is None:
+            # With scale = L*L.T, the quadratic form is |y|**2, where y
+            # is the solution of L*y = delta.
+            y = _forward_solve(_cholesky(scale_entries, n, mp.prec), delta)
+            q = mp.fsum(y, squared=True)
+        else:
+            # scale_inv is symmetric, so only the upper triangle is used.
+            q = mp.fsum([scale_inv[i, i]*delta[i]**2 for i in range(n)]
+                        + [2*scale_inv[i, j]*delta[i]*delta[j]
+                           for i in range(n) for j in range(i + 1, n)])
+        t1 = -c * mp.log1p(q / nu)
+        t6 = _half_logdet(scale_entries, n, mp.prec)
+        return _logpdf_const(nu, p, mp.prec) - t6 + t1
 
 
 def pdf(x, nu, loc, scale, scale_inv=None):
@@ -81,18 +133,18 @@ def entropy(nu, loc, scale):
     Differential entropy of the multivariate t distribution.
 
     `loc` must be a sequence.  `scale` is the scale matrix; it must be an
-    instance of `mpmath.matrix`.  `scale` must be positive definite; the
-    function does not check this.  If `scale` is not positive definite,
-    the return value might not be meaningful.
+    instance of `mpmath.matrix`.  `scale` must be positive definite.
+
+    As in `logpdf`, the determinant of `scale` is computed from its
+    (cached) Cholesky factorization.
     """
+    n = scale.rows
     d = mp.mpf(len(loc))
     with mp.extradps(5):
         nu = mp.mpf(nu)
-        loc = [mp.mpf(t) for t in loc]
+        scale_entries = tuple(scale[i, j] for i in range(n) for j in range(n))
         mean_nu_d = (nu + d)/2
         half_nu = nu/2
-        return (-mp.loggamma(mean_nu_d)
-                + mp.loggamma(half_nu)
-                + (d/2)*mp.log(nu*mp.pi)
+        return (-_logpdf_const(nu, d, mp.prec)
                 + mean_nu_d*(mp.digamma(mean_nu_d) - mp.digamma(half_nu))
-                + mp.log(abs(mp.det(scale)))/2)
+                + _half_logdet(scale_entries, n, mp.prec))
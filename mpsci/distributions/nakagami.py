@@ -18,14 +18,14 @@ infinity as x approaches 0.
 
 """
 
+from functools import lru_cache
 from mpmath import mp
-from mpsci import stats
 from ._common import _validate_x_bounds, _validate_p,  _find_bracket
 
 
 __all__ = ['pdf', 'logpdf', 'cdf', 'invcdf', 'sf', 'invsf',
            'support', 'mean', 'var', 'entropy',
-           'nll', 'mle']
+           'nll', 'nll_grad', 'mle']
 
 
 def _validate_params(nu, loc=0, scale=1):
@@ -36,6 +36,14 @@ def _validate_params(nu, loc=0, scale=1):
     return mp.mpf(nu), mp.mpf(loc), mp.mpf(scale)
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _logpdf_const(nu, prec):
+    # The terms of the log of the standard PDF that depend only on nu,
+    # log(2*nu**nu/Gamma(nu)).
+    return mp.log(2) + nu*mp.log(nu) - mp.loggamma(nu)
+
+
 @mp.extradps(5)
 def pdf(x, nu, loc=0, scale=1):
     """
@@ -46,8 +54,11 @@ def pdf(x, nu, loc=0, scale=1):
         return mp.zero
     x = mp.mpf(x)
     z = (x - loc)/scale
-    return (2*nu**nu * z**(2*nu - 1) * mp.exp(-nu*z**2)
-            / mp.gamma(nu) / scale)
+    if nu == 0.5:
+        # Half-normal distribution.
+        return mp.sqrt(2/mp.pi)*mp.exp(-z**2/2) / scale
+    return (mp.exp(_logpdf_const(nu, mp.prec) + (2*nu - 1)*mp.log(z)
+                   - nu*z**2) / scale)
 
 
 @mp.extradps(5)
@@ -60,10 +71,53 @@ def logpdf(x, nu, loc=0, scale=1):
         return mp.ninf
     x = mp.mpf(x)
     z = (x - loc)/scale
-    return (mp.log(2) + nu*mp.log(nu) - mp.loggamma(nu)
+    if nu == 0.5:
+        # Half-normal distribution; the log(z) term drops out.
+        return _logpdf_const(nu, mp.prec) - z**2/2 - mp.log(scale)
+    return (_logpdf_const(nu, mp.prec)
             + (2*nu-1)*mp.log(z) - nu*z**2 - mp.log(scale))
 
 
+# _cdf_std and _sf_std are the CDF and SF of the standard distribution
+# (loc=0, scale=1).  nu must already be validated, and z must be
+# nonnegative.
+
+def _cdf_std(z, nu):
+    if nu == 0.5:
+        # Half-normal distribution.
+        return mp.erf(z/mp.sqrt(2))
+    return mp.gammainc(nu, 0, nu*z**2, regularized=True)
+
+
+def _sf_std(z, nu):
+    if nu == 0.5:
+        # Half-normal distribution.
+        return mp.erfc(z/mp.sqrt(2))
+    return mp.gammainc(nu, nu*z**2, mp.inf, regularized=True)
+
+
+def _inv_std(p, nu, upper=False):
+    # Solve _cdf_std(z, nu) = p (or _sf_std(z, nu) = p if upper is True)
+    # for z.  p must satisfy 0 < p < 1.
+    if p > 0.5:
+        # Solve the complementary problem, which is better conditioned.
+        p = 1 - p
+        upper = not upper
+    func = _sf_std if upper else _cdf_std
+    # The equation is solved for s = log(z) in the form
+    # log(func(exp(s), nu)) = log(p).  In that form, the function is
+    # close to linear in the tails, so the bracketing solver converges
+    # quickly even when the quantile is extremely small or large.
+
+    def logfunc(s):
+        return mp.log(func(mp.exp(s), nu))
+
+    logp = mp.log(p)
+    s0, s1 = _find_bracket(logfunc, logp, mp.ninf, mp.inf, nbisect=4)
+    s = mp.findroot(lambda s: logfunc(s) - logp, (s0, s1), solver='anderson')
+    return mp.exp(s)
+
+
 @mp.extradps(5)
 def cdf(x, nu, loc=0, scale=1):
     """
@@ -74,7 +128,7 @@ def cdf(x, nu, loc=0, scale=1):
         return mp.zero
     x = mp.mpf(x)
     z = (x - loc)/scale
-    return mp.gammainc(nu, 0, nu*z**2, regularized=True)
+    return _cdf_std(z, nu)
 
 
 @mp.extradps(5)
@@ -82,15 +136,19 @@ def invcdf(p, nu, loc=0, scale=1):
     """
     Inverse of the CDF of the Nakagmi distribution.
 
-    The implementation uses a numerical root finder, so it may be slow, and
-    it may fail to converge for some inputs.
+    The implementation uses a numerical root finder, so it may be slow.
     """
     p = _validate_p(p)
     nu, loc, scale = _validate_params(nu, loc, scale)
+    if p == 0:
+        return loc
+    if p == 1:
+        return mp.inf
+    # Solve for the quantile of the standard distribution, so the
+    # parameters are validated and converted only once.
     with mp.extradps(mp.dps):
-        x0, x1 = _find_bracket(lambda x: cdf(x, nu, loc, scale), p, 0, mp.inf)
-        root = mp.findroot(lambda t: cdf(t, nu, loc, scale) - p, x0=(x0, x1))
-    return root
+        z = _inv_std(p, nu)
+    return loc + scale*z
 
 
 @mp.extradps(5)
@@ -103,7 +161,7 @@ def sf(x, nu, loc=0, scale=1):
         return mp.one
     x = mp.mpf(x)
     z = (x - loc)/scale
-    return mp.gammainc(nu, nu*z**2, mp.inf, regularized=True)
+    return _sf_std(z, nu)
 
 
 @mp.extradps(5)
@@ -111,15 +169,19 @@ def invsf(p, nu, loc=0, scale=1):
     """
     Inverse of the survival function of the Nakagmi distribution.
 
-    The implementation uses a numerical root finder, so it may be slow, and
-    it may fail to converge for some inputs.
+    The implementation uses a numerical root finder, so it may be slow.
     """
     p = _validate_p(p)
     nu, loc, scale = _validate_params(nu, loc, scale)
+    if p == 0:
+        return mp.inf
+    if p == 1:
+        return loc
+    # Solve for the quantile of the standard distribution, so the
+    # parameters are validated and converted only once.
     with mp.extradps(mp.dps):
-        x0, x1 = _find_bracket(lambda x: sf(x, nu, loc, scale), p, 0, mp.inf)
-        root = mp.findroot(lambda t: sf(t, nu, loc, scale) - p, x0=(x0, x1))
-    return root
+        z = _inv_std(p, nu, upper=True)
+    return loc + scale*z
 
 
 @mp.extradps(5)
@@ -131,14 +193,22 @@ def support(nu, loc=0, scale=1):
     return (loc, mp.inf)
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _log_gratio(nu, prec):
+    # log(Gamma(nu + 1/2)/Gamma(nu)).  When nu is large, the subtraction
+    # loses about log2(nu*log(nu)) bits, so extra precision is used.
+    with mp.extraprec(max(0, 2*mp.mag(nu))):
+        return mp.loggamma(nu + mp.mpf(0.5)) - mp.loggamma(nu)
+
+
 @mp.extradps(5)
 def mean(nu, loc=0, scale=1):
     """
     Mean of the Nakagami distribution.
     """
     nu, loc, scale = _validate_params(nu, loc, scale)
-    gratio = mp.gammaprod([nu + 0.5], [nu])
-    mean0 = gratio / mp.sqrt(nu)
+    mean0 = mp.exp(_log_gratio(nu, mp.prec)) / mp.sqrt(nu)
     return loc + scale*mean0
 
 
@@ -148,8 +218,13 @@ def var(nu, loc=0, scale=1):
     Variance of the Nakagami distribution.
     """
     nu, loc, scale = _validate_params(nu, loc, scale)
-    gratio = mp.gammaprod([nu + 0.5], [nu])
-    var0 = 1 - gratio**2/nu
+    # var0 = 1 - Gamma(nu + 1/2)**2/(nu*Gamma(nu)**2).  When nu is large,
+    # var0 is approximately 1/(4*nu), so extra precision is used to
+    # compensate for the cancellation.  (The value returned by
+    # _log_gratio keeps the extra bits that it was computed with.)
+    log_gratio = _log_gratio(nu, mp.prec)
+    with mp.extraprec(max(0, mp.mag(nu))):
+        var0 = -mp.expm1(2*log_gratio - mp.log(nu))
     return scale**2 * var0
 
 
@@ -163,6 +238,29 @@ def entropy(nu, loc=0, scale=1):
             + nu + mp.loggamma(nu) - mp.log(2) + mp.log(scale))
 
 
+def _collect_sums(x, loc, grad=False):
+    # Single pass over x that returns the sums of log(x - loc) and
+    # (x - loc)**2.  If grad is True, the sums of 1/(x - loc) and x - loc
+    # (needed by nll_grad) are also returned.  The values must already be
+    # validated.  The terms are collected in lists so mp.fsum can be used
+    # for each sum.
+    logs = []
+    squares = []
+    inverses = []
+    diffs = []
+    for t in x:
+        d = t - loc
+        logs.append(mp.log(d))
+        squares.append(d*d)
+        if grad:
+            inverses.append(1/d)
+            diffs.append(d)
+    if grad:
+        return (mp.fsum(logs), mp.fsum(squares),
+                mp.fsum(inverses), mp.fsum(diffs))
+    return mp.fsum(logs), mp.fsum(squares)
+
+
 @mp.extradps(5)
 def nll(x, nu, loc, scale):
     """
@@ -171,11 +269,14 @@ def nll(x, nu, loc, scale):
     n = len(x)
     nu, loc, scale = _validate_params(nu, loc, scale)
     x = _validate_x_bounds(x, low=loc, strict_low=True, lowname='loc')
-    z = [(t - loc)/scale for t in x]
-    logsum = mp.fsum([mp.log(t) for t in z])
-    sqsum = mp.fsum([t**2 for t in z])
-    ll = n*(mp.log(2) + nu*mp.log(nu) - mp.loggamma(nu)
-            - mp.log(scale)) + (2*nu - 1)*logsum - nu*sqsum
+    sum_log, sum_sq = _collect_sums(x, loc)
+    # The sums are computed for x - loc; the scale is applied once to
+    # the sums instead of to each term.
+    log_scale = mp.log(scale)
+    logsum = sum_log - n*log_scale
+    sqsum = sum_sq/(scale*scale)
+    ll = (n*(_logpdf_const(nu, mp.prec) - log_scale)
+          + (2*nu - 1)*logsum - nu*sqsum)
     return -ll
 
 
@@ -187,20 +288,18 @@ def nll_grad(x, nu, loc, scale):
     n = len(x)
     nu, loc, scale = _validate_params(nu, loc, scale)
     x = _validate_x_bounds(x, low=loc, strict_low=True, lowname='loc')
-    xloc = [(t - loc) for t in x]
-    dldnu = (n*(1 + mp.log(nu) - mp.digamma(nu))
-             + 2*mp.fsum([mp.log(t/scale) for t in xloc])
-             - mp.fsum([t**2 for t in xloc])/scale**2)
-    sum_inv = mp.fsum([1/t for t in xloc])
-    dldloc = -(2*nu - 1)*sum_inv + 2*nu*mp.fsum(xloc)/scale**2
-    sum_sq = mp.fsum([t**2 for t in xloc])
-    dldscale = (2*nu/scale)*(-n + sum_sq/scale**2)
+    sum_log, sum_sq, sum_inv, sum_xloc = _collect_sums(x, loc, grad=True)
+    scale2 = scale*scale
+    sum_log -= n*mp.log(scale)
+    dldnu = n*(1 + mp.log(nu) - mp.digamma(nu)) + 2*sum_log - sum_sq/scale2
+    dldloc = -(2*nu - 1)*sum_inv + 2*nu*sum_xloc/scale2
+    dldscale = (2*nu/scale)*(-n + sum_sq/scale2)
     return -dldnu, -dldloc, -dldscale
 
 
 def _mle_nu_func(nu, R):
     # This function is used in mle() to solve log(nu) - digamma(nu) = R.
-    nu = mp.mpf(nu)
+    # findroot always passes an mpf, so nu is not converted here.
     return mp.log(nu) - mp.digamma(nu) - R
 
 
@@ -208,12 +307,11 @@ def _estimate_nu(R):
     """
     Estimate the solution of log(nu) - psi(nu) = R.
     """
-    if R >= 10:
-        return 1/R
-    elif R < 5e-1:
-        return 1/(2*R)
-    else:
-        return 1/(1.5*R)
+    # Invert the two-term asymptotic expansion
+    #     log(nu) - psi(nu) ~ 1/(2*nu) + 1/(12*nu**2).
+    # log(nu) - psi(nu) is less than both 1/(2*nu) + 1/(12*nu**2) and
+    # 1/nu, so the value returned is an upper bound of the solution.
+    return min((1 + mp.sqrt(1 + 4*R/3))/(4*R), 1/R)
 
 
 @mp.extradps(5)
@@ -236,7 +334,16 @@ def mle(x, *, nu=None, loc=None, scale=None):
         with mp.extradps(5):
             x = _validate_x_bounds(x, low=loc, strict_low=True, lowname='loc')
             loc0 = mp.mpf(loc)
-            x = [t - loc0 for t in x]
+            # Make a single pass over x to collect the terms of the sums
+            # that are needed below.  The logarithms are only needed if
+            # nu is estimated.
+            squares = []
+            logs = []
+            for t in x:
+                d = t - loc0
+                squares.append(d*d)
+                if nu is None:
+                    logs.append(mp.log(d))
     else:
         raise ValueError('Fitting `loc` is not implemented yet. '
                          '`loc` must be given.  All values in `x` must'
@@ -245,20 +352,28 @@ def mle(x, *, nu=None, loc=None, scale=None):
     # If here, loc is fixed, and we've handled that by shifting x.
     # Either nu or scale (or both) are not fixed.
 
+    n = len(squares)
+    mean_sq = mp.fsum(squares)/n
     if scale is None:
-        scale0 = mp.sqrt(mp.fsum([t**2 for t in x])/len(x))
+        scale0 = mp.sqrt(mean_sq)
     else:
         scale0 = mp.mpf(scale)
 
     if nu is not None:
         nu0 = mp.mpf(nu)
     else:
+        # R = mean((x/scale0)**2) - mean(2*log(x/scale0)) - 1
+        mean_log = mp.fsum(logs)/n
         if scale is None:
-            R = -stats.mean([2*mp.log(t/scale0) for t in x])
+            # scale0**2 is mean(x**2), so mean((x/scale0)**2) is 1.
+            R = 2*(mp.log(scale0) - mean_log)
         else:
-            R = (stats.mean([(t/scale0)**2 for t in x]) -
-                 stats.mean([2*mp.log(t/scale0) for t in x]) - 1)
-        nu0 = _estimate_nu(R)
-        nu0 = mp.findroot(lambda nu: _mle_nu_func(nu, R), nu0)
+            R = mean_sq/scale0**2 - 2*(mean_log - mp.log(scale0)) - 1
+        # log(nu) - psi(nu) > 1/(2*nu), so 1/(2*R) is a lower bound of
+        # the solution, and _estimate_nu(R) is an upper bound.
+        # log(nu) - psi(nu) is monotonic, so a bracketing solver can
+        # be used.
+        nu0 = mp.findroot(lambda nu: _mle_nu_func(nu, R),
+                          (1/(2*R), _estimate_nu(R)), solver='anderson')
 
     return nu0, loc0, scale0
@@ -10,21 +10,6 @@ from ..fun import logbeta as _logbeta
 __all__ = ['pdf', 'cdf', 'support', 'mean', 'var']
 
 
-def _pdf_term(k, x, dfn, dfd, nc):
-    halfnc = nc / 2
-    halfdfn = dfn / 2
-    halfdfd = dfd / 2
-    logr = (-halfnc
-            + k*mp.log(halfnc)
-            - _logbeta(halfdfd, halfdfn + k)
-            - mp.loggamma(k + 1)
-            + (halfdfn + k) * (mp.log(dfn) - mp.log(dfd))
-            + (halfdfn + halfdfd + k) * (mp.log(dfd) -
-                                         mp.log(dfd + dfn*x))
-            + (halfdfn - 1 + k) * mp.log(x))
-    return mp.exp(logr)
-
-
 def pdf(x, dfn, dfd, nc):
     """
     PDF of the noncentral F distribution.
@@ -32,47 +17,99 @@ def pdf(x, dfn, dfd, nc):
     if x < 0:
         return mp.zero
 
-    def _pdfk(k):
-        return _pdf_term(k, x, dfn, dfd, nc)
-
     with mp.extradps(5):
         x = mp.mpf(x)
         dfn = mp.mpf(dfn)
         dfd = mp.mpf(dfd)
         nc = mp.mpf(nc)
-        p = mp.nsum(_pdfk, [0, mp.inf])
-        return p
-
-
-def _cdf_term(k, x, dfn, dfd, nc):
-    halfnc = nc / 2
-    halfdfn = dfn / 2
-    halfdfd = dfd / 2
-    log_coeff = mp.fsum([k*mp.log(halfnc), -halfnc,
-                         -mp.loggamma(k + 1)])
-    coeff = mp.exp(log_coeff)
-    r = coeff * mp.betainc(a=halfdfn + k, b=halfdfd,
-                           x1=0, x2=dfn*x/(dfd + dfn*x), regularized=True)
-    return r
+        halfnc = nc / 2
+        halfdfn = dfn / 2
+        halfdfd = dfd / 2
+        if x == 0:
+            # Only the k = 0 term of the series is nonzero.
+            if dfn < 2:
+                return mp.inf
+            if dfn > 2:
+                return mp.zero
+            return mp.exp(-halfnc)
+        # The PDF is the sum over k of the Poisson(halfnc) PMF at k times
+        # a term that depends on halfdfn + k.  The ratio of consecutive
+        # terms of the series is
+        #     r[k] = halfnc/(k + 1) * (halfdfn + halfdfd + k)/(halfdfn + k) * y
+        # The ratio decreases as k increases, so once it is less than 1,
+        # the rest of the series is bounded by a geometric series.
+        y = dfn*x/(dfd + dfn*x)
+        log1my = mp.log(dfd) - mp.log(dfd + dfn*x)
+        term = mp.exp(-halfnc - _logbeta(halfdfd, halfdfn)
+                      + halfdfn*mp.log(y) + halfdfd*log1my - mp.log(x))
+        terms = [term]
+        total = term
+        k = 0
+        while True:
+            r = (halfnc/(k + 1) * (halfdfn + halfdfd + k)/(halfdfn + k)
+                 * y)
+            term *= r
+            k += 1
+            terms.append(term)
+            total += term
+            if r < 1 and term*r <= mp.eps*(1 - r)*total:
+                break
+        return mp.fsum(terms)
 
 
 def cdf(x, dfn, dfd, nc):
     """
     CDF of the noncentral F distribution.
     """
-    if x < 0:
+    if x <= 0:
         return mp.zero
 
-    def _cdfk(k):
-        return _cdf_term(k, x, dfn, dfd, nc)
-
     with mp.extradps(5):
         x = mp.mpf(x)
         dfn = mp.mpf(dfn)
         dfd = mp.mpf(dfd)
         nc = mp.mpf(nc)
-        p = mp.nsum(_cdfk, [0, mp.inf])
-        return p
+        halfnc = nc / 2
+        halfdfn = dfn / 2
+        halfdfd = dfd / 2
+        # The CDF is sum(w[k]*I[k]), where w[k] is the Poisson(halfnc)
+        # PMF at k and I[k] is the regularized incomplete beta function
+        # I_y(halfdfn + k, halfdfd).  I[k] decreases as k increases, so
+        # the relative size of the tail of the series is bounded by the
+        # relative size of the tail of the Poisson weights.
+        w = mp.exp(-halfnc)
+        weights = [w]
+        wsum = w
+        k = 0
+        while True:
+            q = halfnc/(k + 1)
+            if q < 1 and w*q <= mp.eps*(1 - q)*wsum:
+                break
+            w *= q
+            k += 1
+            weights.append(w)
+            wsum += w
+        # Compute I[k] for the largest k, and then use the recurrence
+        #     I[j] = I[j + 1] + d[j],
+        #     d[j] = y**(halfdfn + j)*(1 - y)**halfdfd
+        #            / ((halfdfn + j)*B(halfdfn + j, halfdfd))
+        # to compute the others.  All the terms are positive, so there
+        # is no loss of precision in the recurrence.
+        y = dfn*x/(dfd + dfn*x)
+        log1my = mp.log(dfd) - mp.log(dfd + dfn*x)
+        a = halfdfn + k
+        beta_inc = mp.betainc(a, halfdfd, 0, y, regularized=True)
+        terms = [weights[k]*beta_inc]
+        if k > 0:
+            a -= 1
+            d = mp.exp(a*mp.log(y) + halfdfd*log1my - mp.log(a)
+                       - _logbeta(a, halfdfd))
+            for j in range(k - 1, -1, -1):
+                beta_inc += d
+                terms.append(weights[j]*beta_inc)
+                if j > 0:
+                    d *= (halfdfn + j)/(y*(halfdfn + halfdfd + j - 1))
+        return mp.fsum(terms)
 
 
 def support(dfn, dfd, nc):
@@ -111,8 +148,9 @@ def var(dfn, dfd, nc):
         nc = mp.mpf(nc)
         dfn = mp.mpf(dfn)
         dfd = mp.mpf(dfd)
-        v = (2*((dfn + nc)**2 +
-                (dfn + 2*nc) * (dfd - 2)) /
-               ((dfd - 2)**2 * (dfd - 4)) *
-             (dfd/dfn)**2)
-        return v
+        dfdm2 = dfd - 2
+        dfnpnc = dfn + nc
+        ratio = dfd/dfn
+        num = 2*(dfnpnc*dfnpnc + (dfnpnc + nc)*dfdm2)
+        den = dfdm2*dfdm2*(dfd - 4)
+        return num/den * ratio*ratio
@@ -15,11 +15,86 @@ from ._common import _validate_moment_n
 __all__ = ['pdf', 'logpdf', 'support', 'mean', 'var', 'noncentral_moment']
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _loggamma_half(df, prec):
+    # loggamma(df/2) is used by all the functions in this module, and df
+    # is often held fixed while the other arguments vary.
+    return mp.loggamma(df/2)
+
+
+def _logpdf_at_zero(df, nc):
+    return (-nc**2/2
+            - mp.log(mp.pi)/2
+            - mp.log(df)/2
+            + mp.loggamma((df + 1)/2)
+            - _loggamma_half(df, mp.prec))
+
+
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _logc_const(df, prec):
+    # The terms of log(c) in _pdf_series that depend only on df.
+    return df*mp.log(df)/2 - _loggamma_half(df, mp.prec) - mp.log(mp.pi)/2
+
+
+def _pdf_series(x, df, nc):
+    # For x != 0, the PDF is c*s, where s is an infinite series.
+    # Returns (log(c), s).  The arguments must be mpf instances.
+    x2 = x**2
+    logc = (_logc_const(df, mp.prec)
+            - nc**2/2
+            - (df + 1)/2 * mp.log(df + x2))
+    # The i-th term of the series is
+    #     Gamma((df + i + 1)/2) * u**i / i!,  u = x*nc*sqrt(2/(df + x**2)).
+    # The ratio of the terms i + 2 and i is the rational expression
+    #     r[i] = (df + i + 1)/2 * u**2/((i + 1)*(i + 2)),
+    # so the terms with even i and the terms with odd i are each
+    # generated with a simple recurrence.
+
+    def _subseries(t, i, u2):
+        # Sum the terms i, i + 2, i + 4, ..., where t is the term i.
+        # r[i] decreases as i increases, so once r[i] < 1, the rest of
+        # the subseries is bounded by a geometric series.
+        terms = [t]
+        total = t
+        while True:
+            r = (df + i + 1)/2 * u2/((i + 1)*(i + 2))
+            t *= r
+            i += 2
+            terms.append(t)
+            total += t
+            if r < 1 and abs(t)*r <= mp.eps*(1 - r)*abs(total):
+                break
+        return mp.fsum(terms)
+
+    # When x*nc < 0, the sum of the odd terms is negative, and the two
+    # subseries can nearly cancel.  In that case, the sums are repeated
+    # with enough extra precision to make up for the bits lost in the
+    # cancellation.
+    extra = 0
+    while True:
+        with mp.extraprec(extra):
+            u = x*nc*mp.sqrt(2/(df + x2))
+            u2 = u**2
+            even = _subseries(mp.gamma((df + 1)/2), 0, u2)
+            odd = _subseries(mp.gamma(df/2 + 1)*u, 1, u2)
+            s = even + odd
+        if u >= 0:
+            break
+        if s > 0:
+            loss = mp.mag(even) - mp.mag(s)
+            if loss <= extra:
+                break
+            extra = loss + 10
+        else:
+            extra = 2*extra + mp.prec
+    return logc, s
+
+
 def pdf(x, df, nc):
     """
     Probability density function of the noncentral t distribution.
-
-    The infinite series is estimated with `mpmath.nsum`.
     """
     with mp.extradps(5):
         x = mp.mpf(x)
@@ -27,30 +102,9 @@ def pdf(x, df, nc):
         nc = mp.mpf(nc)
 
         if x == 0:
-            logp = (-nc**2/2
-                    - mp.log(mp.pi)/2
-                    - mp.log(df)/2
-                    + mp.loggamma((df + 1)/2)
-                    - mp.loggamma(df/2))
-            p = mp.exp(logp)
-        else:
-            logc = (df*mp.log(df)/2
-                    - nc**2/2
-                    - mp.loggamma(df/2)
-                    - mp.log(mp.pi)/2
-                    - (df + 1)/2 * mp.log(df + x**2))
-            c = mp.exp(logc)
-
-            def _pdf_term(i):
-                logterm = (mp.loggamma((df + i + 1)/2)
-                           + i*mp.log(x*nc)
-                           + i*mp.log(2/(df + x**2))/2
-                           - mp.loggamma(i + 1))
-                return mp.exp(logterm).real
-
-            s = mp.nsum(_pdf_term, [0, mp.inf])
-            p = c * s
-        return p
+            return mp.exp(_logpdf_at_zero(df, nc))
+        logc, s = _pdf_series(x, df, nc)
+        return mp.exp(logc) * s
 
 
 def logpdf(x, df, nc):
@@ -63,36 +117,26 @@ def logpdf(x, df, nc):
         nc = mp.mpf(nc)
 
         if x == 0:
-            logp = (-nc**2/2
-                    - mp.log(mp.pi)/2
-                    - mp.log(df)/2
-                    + mp.loggamma((df + 1)/2)
-                    - mp.loggamma(df/2))
-        else:
-            logc = (df*mp.log(df)/2
-                    - nc**2/2
-                    - mp.loggamma(df/2)
-                    - mp.log(mp.pi)/2
-                    - (df + 1)/2 * mp.log(df + x**2))
-
-            def _pdf_term(i):
-                logterm = (mp.loggamma((df + i + 1)/2)
-                           + i*mp.log(x*nc)
-                           + i*mp.log(2/(df + x**2))/2
-                           - mp.loggamma(i + 1))
-                return mp.exp(logterm).real
-
-            s = mp.nsum(_pdf_term, [0, mp.inf])
-            logp = logc + mp.log(s)
-        return logp
+            return _logpdf_at_zero(df, nc)
+        logc, s = _pdf_series(x, df, nc)
+        return logc + mp.log(s)
 
 
 def support(df, nc):
     """
     Support of the noncentral t distribution.
     """
-    with mp.extradps(5):
-        return (mp.ninf, mp.inf)
+    return (mp.ninf, mp.inf)
+
+
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _log_gratio(df, prec):
+    # log(Gamma((df - 1)/2)/Gamma(df/2)).  When df is large, the
+    # subtraction loses about log2(df*log(df)) bits, so extra precision
+    # is used.
+    with mp.extraprec(max(0, 2*mp.mag(df))):
+        return mp.loggamma((df - 1)/2) - _loggamma_half(df, mp.prec)
 
 
 def mean(df, nc):
@@ -103,11 +147,7 @@ def mean(df, nc):
     with mp.extradps(5):
         df = mp.mpf(df)
         nc = mp.mpf(nc)
-        logm = (mp.log(nc)
-                + mp.log(df/2)/2
-                + mp.loggamma((df - 1)/2)
-                - mp.loggamma(df/2))
-        return mp.exp(logm)
+        return nc*mp.sqrt(df/2)*mp.exp(_log_gratio(df, mp.prec))
 
 
 def var(df, nc):
@@ -118,8 +158,14 @@ def var(df, nc):
     with mp.extradps(5):
         df = mp.mpf(df)
         nc = mp.mpf(nc)
-        c = mp.exp(mp.loggamma((df - 1)/2) - mp.loggamma(df/2))
-        return df/(df - 2) * (1 + nc**2) - df/2 * nc**2 * c**2
+        # When df is large, the variance is approximately 1 + nc**2/(2*df),
+        # so extra precision is used to compensate for the cancellation.
+        # (The value returned by _log_gratio keeps the extra bits that it
+        # was computed with.)
+        log_gratio = _log_gratio(df, mp.prec)
+        with mp.extraprec(max(0, mp.mag(df))):
+            c2 = mp.exp(2*log_gratio + mp.log(df/2))
+            return df/(df - 2) * (1 + nc**2) - nc**2 * c2
 
 
 @lru_cache
@@ -128,18 +174,51 @@ def _poly_coeffs(k):
     Generate the coefficients of the polynomial that is the result of
     the expression exp(-x**2/2) * (d^k/dx^k)exp(x**2/2).
 
-    The coefficients are returned in increasing order of the power.
-    That is, the return value [c0, c1, c2, c3] represents the polynomial
-    c0 + c1*x + c2*x**2 + c3*x**3.
+    The coefficients are returned as a tuple in increasing order of the
+    power.  That is, the return value (c0, c1, c2, c3) represents the
+    polynomial c0 + c1*x + c2*x**2 + c3*x**3.
+
+    The polynomials satisfy the recurrence p[k+1] = x*p[k] + k*p[k-1],
+    with p[0] = 1 and p[1] = x.  (They are He_k(i*x)/i**k, where He_k is
+    the probabilists' Hermite polynomial.)
     """
     if k == 0:
-        return [1]
-    c = [0, 1]
-    for _ in range(2, k+1):
-        c = [a + b for a, b in zip([i*j for i, j in enumerate(c[1:], start=1)],
-                                   [0] + c[:-2])]
-        c.extend([0, 1])
-    return c
+        return (1,)
+    p0 = [1]
+    p1 = [0, 1]
+    for j in range(1, k):
+        p = [0] + p1
+        for i, c in enumerate(p0):
+            p[i] += j*c
+        p0, p1 = p1, p
+    return tuple(p1)
+
+
+@lru_cache
+def _poly_coeffs_rev(k):
+    """
+    The nonzero coefficients from _poly_coeffs(k), in decreasing order of
+    the power.
+
+    The polynomial is even when k is even and odd when k is odd, so only
+    the coefficients of x**k, x**(k-2), ..., are returned.
+    """
+    return _poly_coeffs(k)[::-2]
+
+
+def _poly_eval(k, x):
+    """
+    Evaluate the polynomial whose coefficients are _poly_coeffs(k) at x.
+
+    Horner's method is applied in x**2 to the nonzero coefficients.
+    """
+    x2 = x**2
+    result = mp.zero
+    for c in _poly_coeffs_rev(k):
+        result = result*x2 + c
+    if k % 2 == 1:
+        result *= x
+    return result
 
 
 def noncentral_moment(n, df, nc):
@@ -155,8 +234,7 @@ def noncentral_moment(n, df, nc):
         nc = mp.mpf(nc)
         if df <= n:
             return mp.nan
-        c = _poly_coeffs(n)
         return (mp.exp((n/2)*mp.log(df/2)
                        + mp.loggamma((df - n)/2)
-                       - mp.loggamma(df/2))
-                * mp.polyval(c[::-1], nc))
+                       - _loggamma_half(df, mp.prec))
+                * _poly_eval(n, nc))
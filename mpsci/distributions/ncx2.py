@@ -4,7 +4,7 @@ Noncentral chi-square distribution
 """
 
 from mpmath import mp
-from ..fun import marcumq, cmarcumq
+from ..fun import xlogy
 
 
 __all__ = ['pdf', 'cdf', 'sf', 'support', 'mean', 'var']
@@ -20,11 +20,73 @@ def pdf(x, k, lam):
         x = mp.mpf(x)
         k = mp.mpf(k)
         lam = mp.mpf(lam)
+        if lam == 0:
+            # Central chi-square distribution; this is the first term
+            # of the Poisson-weighted series for the PDF.
+            return mp.exp(xlogy(k/2 - 1, x/2) - x/2 - mp.loggamma(k/2))/2
         p = (mp.exp(-(x + lam)/2) * mp.power(x / lam, (k/2 - 1)/2) *
              mp.besseli(k/2 - 1, mp.sqrt(lam*x))/2)
     return p
 
 
+def _poisson_gamma_sum(z, a0, h, upper):
+    # Compute the sum over j >= 0 of w[j]*R(a0 + j, z), where w[j] is
+    # the PMF of the Poisson distribution with mean h, and R is the
+    # regularized lower (upper=False) or upper (upper=True) incomplete
+    # gamma function.  z must be positive.
+    #
+    # The sum starts at the mode j0 of the Poisson distribution and
+    # works outward in both directions.  Only R(a0 + j0, z) is computed
+    # with mp.gammainc; the other values come from the recurrences
+    #     P(a + 1, z) = P(a, z) - g(a),  Q(a + 1, z) = Q(a, z) + g(a),
+    # where g(a) = z**a*exp(-z)/Gamma(a + 1).  P(a, z) decreases and
+    # Q(a, z) increases as a increases, and both are at most 1, so the
+    # tails of the sum are bounded by geometric series.
+    j0 = int(mp.floor(h))
+    a = a0 + j0
+    w0 = mp.exp(xlogy(j0, h) - h - mp.loggamma(j0 + 1))
+    if upper:
+        r0 = mp.gammainc(a, z, mp.inf, regularized=True)
+    else:
+        r0 = mp.gammainc(a, 0, z, regularized=True)
+    g0 = mp.exp(a*mp.log(z) - z - mp.loggamma(a + 1))
+    sign = 1 if upper else -1
+
+    terms = [w0*r0]
+    total = terms[0]
+
+    # Terms j0 + 1, j0 + 2, ...
+    w, r, g, a, j = w0, r0, g0, a0 + j0, j0
+    while True:
+        q = h/(j + 1)
+        if w*q/(1 - q)*(1 if upper else r) <= mp.eps*total:
+            break
+        r += sign*g
+        g *= z/(a + 1)
+        a += 1
+        j += 1
+        w *= q
+        terms.append(w*r)
+        total += w*r
+
+    # Terms j0 - 1, j0 - 2, ..., 0
+    w, r, a, j = w0, r0, a0 + j0, j0
+    g = g0*a/z
+    while j > 0:
+        q = j/h
+        if q < 1 and w*q/(1 - q)*(r if upper else 1) <= mp.eps*total:
+            break
+        w *= q
+        a -= 1
+        j -= 1
+        r -= sign*g
+        g *= a/z
+        terms.append(w*r)
+        total += w*r
+
+    return mp.fsum(terms)
+
+
 def cdf(x, k, lam):
     """
     CDF for the noncentral chi-square distribution.
@@ -35,7 +97,7 @@ def cdf(x, k, lam):
         x = mp.mpf(x)
         k = mp.mpf(k)
         lam = mp.mpf(lam)
-        c = cmarcumq(k/2, mp.sqrt(lam), mp.sqrt(x))
+        c = _poisson_gamma_sum(x/2, k/2, lam/2, upper=False)
     return c
 
 
@@ -49,7 +111,7 @@ def sf(x, k, lam):
         x = mp.mpf(x)
         k = mp.mpf(k)
         lam = mp.mpf(lam)
-        s = marcumq(k/2, mp.sqrt(lam), mp.sqrt(x))
+        s = _poisson_gamma_sum(x/2, k/2, lam/2, upper=True)
     return s
 
 
@@ -57,10 +119,7 @@ def support(k, lam):
     """
     Support of the noncentral chi-square distribution.
     """
-    with mp.extradps(5):
-        k = mp.mpf(k)
-        lam = mp.mpf(lam)
-        return (mp.zero, mp.inf)
+    return (mp.zero, mp.inf)
 
 
 def mean(k, lam):
@@ -10,6 +10,7 @@ a "success".
 """
 
 import itertools
+from functools import lru_cache
 from mpmath import mp
 from ..fun import logbinomial, xlogy, xlog1py
 from ..stats import mean as _mean
@@ -64,13 +65,28 @@ def _validate_x(x):
     for xi in x:
         if xi < 0:
             raise ValueError('All values in x must be nonnegative')
+        if isinstance(xi, int):
+            # Python integers are used as they are; mpmath converts
+            # them when they are combined with mpf instances.
+            y.append(xi)
+            continue
         ximp = mp.mpmathify(xi)
-        if ximp != int(ximp):
+        k = int(ximp)
+        if ximp != k:
             raise ValueError('All values in x must be integers')
-        y.append(ximp)
+        y.append(k)
     return y
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _logpmf0(r, p, prec):
+    # r*log(1 - p), the log of the PMF at k = 0.  It does not depend on k,
+    # so it is cached for repeated calls of logpmf and pmf with the same
+    # parameters.
+    return xlog1py(r, -p)
+
+
 def logpmf(k, r, p):
     """
     Log of the probability mass function of the negative binomial distribution.
@@ -87,7 +103,8 @@ def logpmf(k, r, p):
         k = _validate_k(k)
         if k < 0:
             return mp.ninf
-        return logbinomial(k + r - 1, k) + xlog1py(r, -p) + xlogy(k, p)
+        return (logbinomial(k + r - 1, k) + _logpmf0(r, p, mp.prec)
+                + xlogy(k, p))
 
 
 def pmf(k, r, p):
@@ -139,7 +156,11 @@ def cdf(k, r, p):
         k = _validate_k(k)
         if k < 0:
             return mp.zero
-        return mp.betainc(k + 1, r, p, 1, regularized=True)
+        # This is betainc(k + 1, r, p, 1, regularized=True), expressed
+        # with the symmetry I_x(a, b) = 1 - I_{1-x}(b, a) so that mpmath
+        # does not compute it as the difference of two integrals, which
+        # loses precision when the CDF is small.
+        return mp.betainc(r, k + 1, 0, 1 - p, regularized=True)
 
 
 def mean(r, p):
@@ -153,9 +174,8 @@ def mean(r, p):
     p : float
         Probability of success.
     """
-    with mp.extradps(5):
-        r, p = _validate_params(r, p)
-        return p*r / (1 - p)
+    r, p = _validate_params(r, p)
+    return p*r / (1 - p)
 
 
 def var(r, p):
@@ -169,9 +189,46 @@ def var(r, p):
     p : float
         Probability of success.
     """
-    with mp.extradps(5):
-        r, p = _validate_params(r, p)
-        return p*r / (1 - p)**2
+    r, p = _validate_params(r, p)
+    return p*r / (1 - p)**2
+
+
+def _grouped(x, counts):
+    # Combine repeated values in x.  Returns the sorted distinct values
+    # and their total counts.
+    groups = {}
+    if counts is None:
+        counts = [1]*len(x)
+    for xi, count in zip(x, counts):
+        groups[xi] = groups.get(xi, 0) + count
+    values = sorted(groups)
+    return values, [groups[v] for v in values]
+
+
+# Largest gap between consecutive distinct values that is bridged with
+# a recurrence in _sum_logbinomial and _mean_digamma_diff.
+_MAX_RECURRENCE_STEPS = 50
+
+
+def _sum_logbinomial(values, weights, r):
+    # Weighted sum of logbinomial(v + r - 1, v) for v in values.
+    # values must be sorted nonnegative integers.  The terms are computed
+    # with the recurrence
+    #     logbinomial(v + r - 1, v) = logbinomial(k + r - 1, k)
+    #                                 + log(rf(k + r, v - k)/rf(k + 1, v - k))
+    # for k < v, so only one log is needed for each distinct value.
+    terms = []
+    lb = mp.zero
+    k = 0
+    for v, w in zip(values, weights):
+        v = int(v)
+        if v - k > _MAX_RECURRENCE_STEPS:
+            lb = logbinomial(v + r - 1, v)
+        elif v > k:
+            lb += mp.log(mp.rf(k + r, v - k)/mp.rf(k + 1, v - k))
+        k = v
+        terms.append(w*lb)
+    return mp.fsum(terms)
 
 
 def nll(x, r, p, *, counts=None):
@@ -194,9 +251,40 @@ def nll(x, r, p, *, counts=None):
     with mp.extradps(5):
         r, p = _validate_params(r, p)
         x = _validate_x(x)
-        counts = _validate_counts(x, counts, expand_none=True)
-        return -mp.fsum([count*logpmf(xi, r, p)
-                         for xi, count in zip(x, counts)])
+        counts = _validate_counts(x, counts, expand_none=False)
+        values, weights = _grouped(x, counts)
+        return _nll(values, weights, r, p)
+
+
+def _nll(values, weights, r, p):
+    # Negative log-likelihood of the sample given as the distinct values
+    # and their counts (see _grouped).  The arguments must already be
+    # validated.  The sum of count*logpmf(xi, r, p) is computed with the
+    # terms that do not depend on xi pulled out of the sum.
+    n = mp.fsum(weights)
+    total = mp.fsum([w*v for v, w in zip(values, weights)])
+    return -(_sum_logbinomial(values, weights, r)
+             + xlog1py(n*r, -p) + xlogy(total, p))
+
+
+def _mean_digamma_diff(values, weights, r):
+    # Weighted mean of digamma(v + r) - digamma(r) for v in values.
+    # values must be sorted nonnegative integers.  The differences are
+    # computed with the recurrence digamma(z + 1) = digamma(z) + 1/z,
+    # so there is no cancellation in the subtraction, and only one
+    # digamma evaluation is needed for each large gap in the values.
+    terms = []
+    d = mp.zero
+    k = 0
+    for v, w in zip(values, weights):
+        v = int(v)
+        if v - k > _MAX_RECURRENCE_STEPS:
+            d = mp.digamma(v + r) - mp.digamma(r)
+        else:
+            d += mp.fsum([1/(r + j) for j in range(k, v)])
+        k = v
+        terms.append(w*d)
+    return mp.fsum(terms) / mp.fsum(weights)
 
 
 def mle(x, *, counts=None, r=None, p=None, allow_noninteger_r=True):
@@ -225,11 +313,12 @@ def mle(x, *, counts=None, r=None, p=None, allow_noninteger_r=True):
         # r is not fixed.
         if not p_fixed:
             m = _mean(x, weights=counts)
+            values, weights = _grouped(x, counts)
 
             def mle_r_eqn(r):
                 p1 = m/(r + m)
-                return (_mean([mp.digamma(xi + r) for xi in x], weights=counts)
-                        - mp.digamma(r) + mp.log1p(-p1))
+                return (_mean_digamma_diff(values, weights, r)
+                        + mp.log1p(-p1))
 
             r0 = 1 if r is None else r.initial
             rhat = mp.findroot(mle_r_eqn, r0)
@@ -241,8 +330,10 @@ def mle(x, *, counts=None, r=None, p=None, allow_noninteger_r=True):
             rhat1 = mp.ceil(rhat)
             phat0 = m/(rhat0 + m)
             phat1 = m/(rhat1 + m)
-            nll0 = nll(x, r=rhat0, p=phat0, counts=counts)
-            nll1 = nll(x, r=rhat1, p=phat1, counts=counts)
+            if rhat0 == 0:
+                return rhat1, phat1
+            nll0 = _nll(values, weights, rhat0, phat0)
+            nll1 = _nll(values, weights, rhat1, phat1)
             if nll0 <= nll1:
                 return rhat0, phat0
             else:
@@ -250,11 +341,11 @@ def mle(x, *, counts=None, r=None, p=None, allow_noninteger_r=True):
         else:
             # r is free, p is fixed.
             _, p = _validate_params(1, p)
-            m = _mean(x, weights=counts)
+            values, weights = _grouped(x, counts)
 
             def mle_r_eqn(r):
-                return (_mean([mp.digamma(xi + r) for xi in x], weights=counts)
-                        - mp.digamma(r) + mp.log1p(-p))
+                return (_mean_digamma_diff(values, weights, r)
+                        + mp.log1p(-p))
 
             r0 = 1 if r is None else r.initial
             rhat = mp.findroot(mle_r_eqn, r0)
@@ -263,8 +354,10 @@ def mle(x, *, counts=None, r=None, p=None, allow_noninteger_r=True):
             # Integer r is required.
             rhat0 = mp.floor(rhat)
             rhat1 = mp.ceil(rhat)
-            nll0 = nll(x, r=rhat0, p=p, counts=counts)
-            nll1 = nll(x, r=rhat1, p=p, counts=counts)
+            if rhat0 == 0:
+                return rhat1, p
+            nll0 = _nll(values, weights, rhat0, p)
+            nll1 = _nll(values, weights, rhat1, p)
             if nll0 <= nll1:
                 return rhat0, p
             else:
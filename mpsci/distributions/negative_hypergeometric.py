@@ -3,6 +3,7 @@ Negative hypergeometric distribution
 ------------------------------------
 """
 
+from functools import lru_cache
 from mpmath import mp
 from ..fun import logbinomial
 from .hypergeometric import cdf as hg_cdf, sf as hg_sf
@@ -30,12 +31,28 @@ def pmf(k, ntotal, ngood, untilnbad):
         return mp.zero
 
     with mp.extradps(5):
+        # At the ends of the support, one of the binomial coefficients
+        # in the numerator is 1.
+        if k == 0:
+            return (mp.binomial(ntotal - untilnbad, ngood)
+                    / mp.binomial(ntotal, ngood))
+        if k == ngood:
+            return (mp.binomial(ngood + untilnbad - 1, ngood)
+                    / mp.binomial(ntotal, ngood))
         b1 = mp.binomial(k + untilnbad - 1, k)
         b2 = mp.binomial(ntotal - untilnbad - k, ngood - k)
         b3 = mp.binomial(ntotal, ngood)
         return b1 * (b2 / b3)
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _log_normalizer(ntotal, ngood, prec):
+    # logbinomial(ntotal, ngood) does not depend on k, so it is computed
+    # once when logpmf is evaluated over the support.
+    return logbinomial(ntotal, ngood)
+
+
 def logpmf(k, ntotal, ngood, untilnbad):
     """
     Logarithm of the prob. mass function of the negative hypergeometric distr.
@@ -48,7 +65,7 @@ def logpmf(k, ntotal, ngood, untilnbad):
     with mp.extradps(5):
         t1 = logbinomial(k + untilnbad - 1, k)
         t2 = logbinomial(ntotal - untilnbad - k, ngood - k)
-        t3 = logbinomial(ntotal, ngood)
+        t3 = _log_normalizer(ntotal, ngood, mp.prec)
         return mp.fsum([t1, t2, -t3])
 
 
@@ -139,8 +156,17 @@ def support_pmf(ntotal, ngood, untilnbad):
         m = 1
     else:
         m = ngood + 1
-    p = []
     support = range(m)
-    for k in support:
-        p.append(pmf(k, ntotal, ngood, untilnbad))
+    # Only pmf(0) is computed directly; the rest use the recurrence
+    #     pmf(k + 1) = pmf(k)*(k + untilnbad)*(ngood - k)
+    #                  / ((k + 1)*(ntotal - untilnbad - k)).
+    # Each step rounds twice, so the precision is increased enough to
+    # absorb the accumulated rounding error.
+    with mp.extraprec(10 + int(m).bit_length()):
+        pk = pmf(0, ntotal, ngood, untilnbad)
+        p = [pk]
+        for k in range(m - 1):
+            pk = (pk * ((k + untilnbad)*(ngood - k))
+                  / ((k + 1)*(ntotal - untilnbad - k)))
+            p.append(pk)
     return support, p
@@ -3,6 +3,7 @@ Normal distribution
 -------------------
 """
 
+from functools import lru_cache
 from mpmath import mp
 from ._common import _validate_loc_scale, _validate_p, _seq_to_mp
 
@@ -11,6 +12,12 @@ __all__ = ['pdf', 'logpdf', 'cdf', 'sf', 'invcdf', 'invsf',
            'support', 'entropy', 'mle']
 
 
+# The precision is an argument so it is part of the cache key.
+@lru_cache()
+def _half_log_2pi(prec):
+    return mp.log(2*mp.pi)/2
+
+
 @mp.extradps(5)
 def pdf(x, mu=0, sigma=1):
     """
@@ -28,7 +35,7 @@ def logpdf(x, mu=0, sigma=1):
     """
     x = mp.mpf(x)
     mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-    logp = (-mp.log(2*mp.pi)/2 - mp.log(sigma)
+    logp = (-_half_log_2pi(mp.prec) - mp.log(sigma)
             - (x - mu)**2/(2*sigma**2))
     return logp
 
@@ -50,7 +57,14 @@ def sf(x, mu=0, sigma=1):
     """
     x = mp.mpf(x)
     mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-    return mp.ncdf(-x + 2*mu, mu, sigma)
+    return mp.erfc((x - mu)/(sigma*mp.sqrt(2)))/2
+
+
+def _erfinv_arg_prec(p):
+    # When p is small, 2*p - 1 and 1 - 2*p lose about -log2(p) bits, so
+    # the precision is increased by that much while the argument of erfinv
+    # is formed.
+    return mp.extraprec(max(0, -mp.mag(p)) if p > 0 else 0)
 
 
 def invcdf(p, mu=0, sigma=1):
@@ -60,10 +74,11 @@ def invcdf(p, mu=0, sigma=1):
     This function is also known as the quantile function or the percent
     point function.
     """
-    with mp.extradps(mp.dps):
+    with mp.extradps(5):
         p = _validate_p(p)
         mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-        a = mp.erfinv(2*p - 1)
+        with _erfinv_arg_prec(p):
+            a = mp.erfinv(2*p - 1)
         x = mp.sqrt(2)*sigma*a + mu
         return x
 
@@ -72,10 +87,11 @@ def invsf(p, mu=0, sigma=1):
     """
     Inverse of the survival function of the normal distribution.
     """
-    with mp.extradps(mp.dps):
+    with mp.extradps(5):
         p = _validate_p(p)
         mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-        a = mp.erfinv(1 - 2*p)
+        with _erfinv_arg_prec(p):
+            a = mp.erfinv(1 - 2*p)
         x = mp.sqrt(2)*sigma*a + mu
         return x
 
@@ -95,7 +111,7 @@ def entropy(mu=0, sigma=1):
     Differential entropy of the normal distribution.
     """
     mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-    return (mp.log(2*mp.pi) + 1)/2 + mp.log(sigma)
+    return _half_log_2pi(mp.prec) + mp.mpf(0.5) + mp.log(sigma)
 
 
 @mp.extradps(5)
@@ -105,7 +121,9 @@ def nll(x, mu=1, sigma=1):
     """
     x = _seq_to_mp(x)
     mu, sigma = _validate_loc_scale(mu, sigma, scale_name='sigma')
-    return -mp.fsum([logpdf(t, mu, sigma) for t in x])
+    n = len(x)
+    ss = mp.fsum([(t - mu)**2 for t in x])
+    return n*(_half_log_2pi(mp.prec) + mp.log(sigma)) + ss/(2*sigma**2)
 
 
 # XXX Add standard errors and confidence intervals for the fitted parameters.
@@ -119,7 +137,7 @@ def mle(x):
     """
     x = _seq_to_mp(x)
     N = len(x)
-    meanx = sum(x) / N
-    var = sum((xi - meanx)**2 for xi in x) / N
+    meanx = mp.fsum(x) / N
+    var = mp.fsum([(xi - meanx)**2 for xi in x]) / N
     sigma = mp.sqrt(var)
     return meanx, sigma
@@ -83,6 +83,19 @@ def test_invsf():
         assert mp.almosteq(invsf, expected)
 
 
+@pytest.mark.parametrize('x', [1e-6, 0.25, 1.0, 7.5, 1e6])
+@mp.workdps(60)
+def test_cdf_invcdf_sf_invsf_roundtrip(x):
+    mu = 0.5
+    sigma = 2.0
+    # The tolerance allows for the loss of precision in forming 2*p - 1
+    # when p is small.
+    p = lognormal.cdf(x, mu, sigma)
+    assert mp.almosteq(lognormal.invcdf(p, mu, sigma), x, rel_eps=1e-45)
+    p = lognormal.sf(x, mu, sigma)
+    assert mp.almosteq(lognormal.invsf(p, mu, sigma), x, rel_eps=1e-45)
+
+
 def test_mean():
     mu = 2.0
     sigma = 3.0
@@ -139,6 +152,17 @@ def test_kurtosis():
         assert mp.almosteq(kurt, expected)
 
 
+@mp.workdps(50)
+def test_kurtosis_small_sigma():
+    sigma = mp.mpf('1e-10')
+    # Computed with mpmath at 300 digits of precision using the formula
+    #     exp(4*sigma**2) + 2*exp(3*sigma**2) + 3*exp(2*sigma**2) - 6
+    expected = mp.mpf('1.60000000000000000002300000000000000000023666666666666'
+                      '666667e-19')
+    kurt = lognormal.kurtosis(0, sigma)
+    assert mp.almosteq(kurt, expected)
+
+
 @mp.workdps(50)
 def test_entropy_with_integral():
     check_entropy_with_integral(lognormal, (2, 3))
@@ -56,6 +56,16 @@ def test_kurtosis():
     assert mp.almosteq(kurt, ref)
 
 
+@mp.workdps(50)
+def test_nll():
+    x = [1, 2, 3, 7]
+    counts = [5, 0, 2, 1]
+    p = mp.mpf('0.625')
+    nll = logseries.nll(x, p, counts=counts)
+    expected = -mp.fsum([c*logseries.logpmf(k, p) for k, c in zip(x, counts)])
+    assert mp.almosteq(nll, expected)
+
+
 @pytest.mark.parametrize(
     'x',                                                   # mean
     [[1]*49 + [2],                                         # 1.02
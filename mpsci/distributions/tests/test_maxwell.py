@@ -65,3 +65,14 @@ def test_sf_invsf_roundtrip(x):
     p = maxwell.sf(x, loc, scale)
     x1 = maxwell.invsf(p, loc, scale)
     assert mp.almosteq(x1, x)
+
+
+@pytest.mark.parametrize('x', [-0.5, 2.5, 10.0])
+@mp.workdps(50)
+def test_invcdf_invsf_loc(x):
+    loc = -1
+    scale = 2.5
+    p = maxwell.cdf(x, loc, scale)
+    assert mp.almosteq(maxwell.invcdf(p, loc, scale), x)
+    p = maxwell.sf(x, loc, scale)
+    assert mp.almosteq(maxwell.invsf(p, loc, scale), x)
@@ -0,0 +1,74 @@
+import pytest
+from mpmath import mp
+from mpsci.distributions import multivariate_hypergeometric
+
+
+def test_support():
+    sup = list(multivariate_hypergeometric.support([2, 0, 3], 3))
+    assert sup == [[0, 0, 3], [1, 0, 2], [2, 0, 1]]
+
+
+@pytest.mark.parametrize('colors, nsample',
+                         [([3], 2), ([4, 5, 6], 6), ([1, 4, 0, 2, 3], 5),
+                          ([2, 3], 0), ([2, 3], 5)])
+def test_support_size(colors, nsample):
+    sup = list(multivariate_hypergeometric.support(colors, nsample))
+    assert all(sum(x) == nsample for x in sup)
+    assert all(0 <= k <= c for x in sup for k, c in zip(x, colors))
+    assert len(set(map(tuple, sup))) == len(sup)
+    # The number of points in the support is the coefficient of
+    # z**nsample in the product of the polynomials (1 + z + ... + z**c)
+    # for c in colors.
+    coeffs = [1]
+    for c in colors:
+        new = [0]*(len(coeffs) + c)
+        for i, a in enumerate(coeffs):
+            for j in range(c + 1):
+                new[i + j] += a
+        coeffs = new
+    assert len(sup) == coeffs[nsample]
+
+
+@mp.workdps(50)
+def test_entropy():
+    colors = [5, 10, 15]
+    nsample = 18
+    h = multivariate_hypergeometric.entropy(colors, nsample)
+    expected = -mp.fsum([
+        multivariate_hypergeometric.pmf(x, colors, nsample)
+        * multivariate_hypergeometric.logpmf(x, colors, nsample)
+        for x in multivariate_hypergeometric.support(colors, nsample)
+    ])
+    assert mp.almosteq(h, expected)
+
+
+@mp.workdps(50)
+def test_cov_with_support_sum():
+    colors = [1, 2, 4, 3]
+    nsample = 5
+    c = multivariate_hypergeometric.cov(colors, nsample)
+    m = multivariate_hypergeometric.mean(colors, nsample)
+    sup = list(multivariate_hypergeometric.support(colors, nsample))
+    p = [multivariate_hypergeometric.pmf(x, colors, nsample) for x in sup]
+    n = len(colors)
+    for i in range(n):
+        for j in range(n):
+            expected = mp.fsum([pk*(x[i] - m[i])*(x[j] - m[j])
+                                for pk, x in zip(p, sup)])
+            assert mp.almosteq(c[i][j], expected)
+
+
+def test_logpmf_precision_change():
+    # The cached logbinomial values are keyed on the precision, so
+    # a result computed at low precision must not leak into a later
+    # computation at higher precision.
+    point = (2, 1, 3)
+    colors = [4, 5, 6]
+    nsample = 6
+    with mp.workdps(15):
+        multivariate_hypergeometric.logpmf(point, colors, nsample)
+    with mp.workdps(60):
+        logp = multivariate_hypergeometric.logpmf(point, colors, nsample)
+        expected = mp.log(mp.binomial(4, 2)*mp.binomial(5, 1)
+                          * mp.binomial(6, 3)/mp.binomial(15, 6))
+        assert mp.almosteq(logp, expected)
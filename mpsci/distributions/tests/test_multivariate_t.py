@@ -1,3 +1,4 @@
+import pytest
 from mpmath import mp
 from mpsci.distributions import multivariate_t
 
@@ -103,3 +104,32 @@ def test_entropy_with_integral_b():
     entr = multivariate_t.entropy(nu, loc, scale=scale)
     expected = mp.mpf('4.335282538640347213506234826838699526984906327')
     assert mp.almosteq(entr, expected)
+
+
+@mp.workdps(50)
+def test_logpdf_with_scale_inv():
+    scale = mp.matrix([[5, 2, 1], [2, 4, -1], [1, -1, 3]])
+    scale_inv = mp.inverse(scale)
+    x = [1, -2, mp.mpf('0.5')]
+    loc = [0, 1, 2]
+    nu = 7
+    lp1 = multivariate_t.logpdf(x, nu, loc, scale)
+    lp2 = multivariate_t.logpdf(x, nu, loc, scale, scale_inv=scale_inv)
+    assert mp.almosteq(lp1, lp2)
+    # Compare to the formula, computed with the explicit inverse and
+    # determinant of scale.
+    delta = mp.matrix(x) - mp.matrix(loc)
+    q = (delta.T * scale_inv * delta)[0, 0]
+    p = len(x)
+    expected = (mp.loggamma((nu + p)/2) - mp.loggamma(mp.mpf(nu)/2)
+                - (p/mp.mpf(2))*mp.log(nu*mp.pi) - mp.log(mp.det(scale))/2
+                - (nu + p)/mp.mpf(2)*mp.log1p(q/nu))
+    assert mp.almosteq(lp1, expected)
+
+
+def test_logpdf_length_mismatch():
+    A = mp.eye(2)
+    with pytest.raises(ValueError, match='len.loc.'):
+        multivariate_t.logpdf([1, 2], 3, [0, 0, 0], A)
+    with pytest.raises(ValueError, match='len.x.'):
+        multivariate_t.logpdf([1, 2, 3], 3, [0, 0], A)
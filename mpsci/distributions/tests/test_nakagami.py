@@ -94,22 +94,22 @@ def test_cdf(x, nu, scale, ref):
     assert mp.almosteq(p, ref)
 
 
-@pytest.mark.parametrize('x', [1, 4, 16])
+@pytest.mark.parametrize('x, loc', [(1, 0.0), (4, 0.0), (16, 0.0),
+                                    (-2.5, -3.0), (4, -3.0), (12, 2.0)])
 @mp.workdps(50)
-def test_cdf_invcdf_roundtrip(x):
+def test_cdf_invcdf_roundtrip(x, loc):
     nu = 1.5
-    loc = 0.0
     scale = 5.0
     p = nakagami.cdf(x, nu, loc, scale)
     x1 = nakagami.invcdf(p, nu, loc, scale)
     assert mp.almosteq(x1, x)
 
 
-@pytest.mark.parametrize('x', [1, 4, 16])
+@pytest.mark.parametrize('x, loc', [(1, 0.0), (4, 0.0), (16, 0.0),
+                                    (-2.5, -3.0), (4, -3.0), (12, 2.0)])
 @mp.workdps(50)
-def test_sf_invsf_roundtrip(x):
+def test_sf_invsf_roundtrip(x, loc):
     nu = 1.5
-    loc = 0.0
     scale = 5.0
     p = nakagami.sf(x, nu, loc, scale)
     x1 = nakagami.invsf(p, nu, loc, scale)
@@ -177,6 +177,15 @@ def test_var(nu, scale, ref):
     assert mp.almosteq(v, ref)
 
 
+@mp.workdps(40)
+def test_var_large_nu():
+    nu = mp.mpf(10**12)
+    with mp.workdps(200):
+        ref = 1 - mp.gammaprod([nu + mp.mpf(0.5)], [nu])**2/nu
+    v = nakagami.var(nu)
+    assert mp.almosteq(v, ref)
+
+
 @mp.workdps(50)
 def test_nll_grad():
     nu = 2
@@ -198,7 +207,8 @@ def test_nll_grad():
 @pytest.mark.parametrize(
     'x',
     [[2, 4, 8, 16],
-     [5.375, 4.625, 4.250, 5.125, 5.000, 5.125, 4.250, 4.500, 5.125, 5.500]]
+     [5.375, 4.625, 4.250, 5.125, 5.000, 5.125, 4.250, 4.500, 5.125, 5.500],
+     [1e-12, 1e-8, 1, 3, 1e4]]
 )
 @mp.workdps(40)
 def test_mle(x):
@@ -236,3 +246,38 @@ def test_entropy():
     nu = 3
     scale = 8
     check_entropy_with_integral(nakagami, (nu, scale))
+
+
+@mp.workdps(50)
+def test_half_normal():
+    # When nu = 1/2, the distribution is the half-normal distribution.
+    nu = mp.mpf(0.5)
+    loc = mp.mpf(-1)
+    scale = mp.mpf(3)
+    x = mp.mpf(2.5)
+    z = (x - loc)/scale
+    pdf = mp.sqrt(2/mp.pi)*mp.exp(-z**2/2)/scale
+    assert mp.almosteq(nakagami.pdf(x, nu, loc, scale), pdf)
+    assert mp.almosteq(nakagami.logpdf(x, nu, loc, scale), mp.log(pdf))
+    cdf = mp.erf(z/mp.sqrt(2))
+    assert mp.almosteq(nakagami.cdf(x, nu, loc, scale), cdf)
+    assert mp.almosteq(nakagami.sf(x, nu, loc, scale), 1 - cdf)
+    assert mp.almosteq(nakagami.invcdf(cdf, nu, loc, scale), x)
+
+
+@pytest.mark.parametrize('nu', [0.3, 2.5, 30])
+@pytest.mark.parametrize('p', ['1e-30', '1e-10', '0.001', '0.999999'])
+@mp.workdps(40)
+def test_invcdf_invsf_tails(p, nu):
+    p = mp.mpf(p)
+    x = nakagami.invcdf(p, nu, scale=2)
+    assert mp.almosteq(nakagami.cdf(x, nu, scale=2), p)
+    x = nakagami.invsf(p, nu, scale=2)
+    assert mp.almosteq(nakagami.sf(x, nu, scale=2), p)
+
+
+def test_invcdf_invsf_endpoints():
+    assert nakagami.invcdf(0, 2, loc=1) == 1
+    assert nakagami.invcdf(1, 2, loc=1) == mp.inf
+    assert nakagami.invsf(0, 2, loc=1) == mp.inf
+    assert nakagami.invsf(1, 2, loc=1) == 1
@@ -42,3 +42,26 @@ def test_basic_mean():
 def test_basic_var():
     assert mp.almosteq(ncf.var(10, 16, mp.mpf('1/4')),
                        mp.mpf('4033/7350'))
+
+
+@mp.workdps(50)
+def test_pdf_cdf_central():
+    # With nc = 0, the distribution is the (central) F distribution.
+    x = mp.mpf(2)
+    dfn = 3
+    dfd = 5
+    y = dfn*x/(dfd + dfn*x)
+    expected_cdf = mp.betainc(mp.mpf(dfn)/2, mp.mpf(dfd)/2, 0, y,
+                              regularized=True)
+    assert mp.almosteq(ncf.cdf(x, dfn, dfd, 0), expected_cdf)
+    expected_pdf = (mp.sqrt((dfn*x)**dfn * dfd**dfd
+                            / (dfn*x + dfd)**(dfn + dfd))
+                    / (x*mp.beta(mp.mpf(dfn)/2, mp.mpf(dfd)/2)))
+    assert mp.almosteq(ncf.pdf(x, dfn, dfd, 0), expected_pdf)
+
+
+@mp.workdps(50)
+def test_pdf_at_zero():
+    assert ncf.pdf(0, 1, 5, 1) == mp.inf
+    assert mp.almosteq(ncf.pdf(0, 2, 5, 1), mp.exp(-mp.mpf(1)/2))
+    assert ncf.pdf(0, 4, 5, 1) == 0
@@ -29,6 +29,8 @@ def test_basic_mean():
     # Wolfram Alpha:
     #   Mean[NoncentralStudentTDistribution[7, 1/2]]
     assert mp.almosteq(m, 4*mp.sqrt(14/mp.pi)/15)
+    m = nct.mean(7, -0.5)
+    assert mp.almosteq(m, -4*mp.sqrt(14/mp.pi)/15)
 
 
 @mp.workdps(50)
@@ -40,6 +42,16 @@ def test_basic_var():
     assert mp.almosteq(v, expected)
 
 
+@mp.workdps(50)
+def test_var_large_df():
+    v = nct.var(1e8, 2)
+    # Computed with mp.dps = 120 and the formula
+    #     df/(df - 2)*(1 + nc**2) - df/2*nc**2*c**2,
+    # where c = mp.gammaprod([(df - 1)/2], [df/2]).
+    expected = mp.mpf('1.0000000400000011500000287500006615625143921878015')
+    assert mp.almosteq(v, expected)
+
+
 # The exected values in the following were computed by numerical integration,
 # e.g. for n=3, df=4, mu=1:
 #
@@ -64,3 +76,15 @@ def test_basic_var():
 def test_noncentral_moment(n, df, nc, val):
     m = nct.noncentral_moment(n, df, nc)
     assert mp.almosteq(m, mp.mpf(val))
+
+
+# The expected values in the following were computed by summing the
+# series for the PDF with mp.nsum with mp.dps = 400.  With x*nc < 0,
+# the terms of the series alternate in sign and nearly cancel.
+@mp.workdps(30)
+def test_pdf_logpdf_negative_x_nc():
+    x, df, nc = -10, 5, 10
+    p = nct.pdf(x, df, nc)
+    assert mp.almosteq(p, mp.mpf('1.11815715342141572473606684827597e-31'))
+    logp = nct.logpdf(x, df, nc)
+    assert mp.almosteq(logp, mp.mpf('-71.2684559513945014151885917718385'))
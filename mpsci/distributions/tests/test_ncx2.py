@@ -16,6 +16,14 @@ def test_basic_pdf():
     assert mp.almosteq(ncx2.pdf(100, 2, 3), expected)
 
 
+@mp.workdps(50)
+def test_pdf_central():
+    # With lam = 0, the distribution is the central chi-square distribution.
+    x = mp.mpf('2.5')
+    assert mp.almosteq(ncx2.pdf(x, 4, 0), x/4*mp.exp(-x/2))
+    assert mp.almosteq(ncx2.pdf(1, 3, 0), mp.exp(-0.5)/mp.sqrt(2*mp.pi))
+
+
 @mp.workdps(50)
 def test_basic_cdf_sf():
 
@@ -33,6 +41,20 @@ def test_basic_cdf_sf():
     assert mp.almosteq(c, expected)
 
 
+# The expected values were computed with mp.dps = 80 by summing the
+# Poisson-weighted series of regularized incomplete gamma functions
+# with mp.nsum.
+@mp.workdps(50)
+def test_cdf_sf_small_tail():
+    c = ncx2.cdf(3, 1.5, 40)
+    expected = mp.mpf('1.5493411740695512896828174281404316704166794746582e-6')
+    assert mp.almosteq(c, expected)
+
+    s = ncx2.sf(200, 5, 100)
+    expected = mp.mpf('3.5243878099594200626948387686207329558036844110915e-5')
+    assert mp.almosteq(s, expected)
+
+
 @mp.workdps(50)
 def test_basic_mean_var():
     assert ncx2.mean(2, 3) == 5
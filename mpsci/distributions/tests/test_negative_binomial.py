@@ -36,7 +36,8 @@ def test_pmf(k, r, p, ref):
 @pytest.mark.parametrize(
     'k, r, p, ref',
     [(3, 8, 0.625, '20_726_199/1_073_741_824'),
-     (10, 2.5, 0.125, '0.999999996873254423162636297285363712912154')]
+     (10, 2.5, 0.125, '0.999999996873254423162636297285363712912154'),
+     (2, 5, 255/256, '1_367_311/72_057_594_037_927_936')]
 )
 @mp.workdps(40)
 def test_cdf(k, r, p, ref):
@@ -84,6 +85,18 @@ def test_nll_counts(x, r, p):
     assert mp.almosteq(nll1, nll2)
 
 
+@pytest.mark.parametrize(
+    'x, r, p',
+    [([0, 1, 1, 3, 7, 12], 2.5, 0.375),
+     ([4, 9, 9, 10, 250, 251, 1000], 3, 0.875)],
+)
+@mp.workdps(50)
+def test_nll_logpmf_sum(x, r, p):
+    nll = negative_binomial.nll(x, r=r, p=p)
+    expected = -mp.fsum([negative_binomial.logpmf(k, r, p) for k in x])
+    assert mp.almosteq(nll, expected)
+
+
 @mp.workdps(25)
 @pytest.mark.parametrize('x', [[0, 1, 2, 3, 5, 8, 13],
                                [0]*155 + [1]*39 + [2]*6 + [3]*1])
@@ -119,3 +132,25 @@ def test_mle_fixed_p(use_counts):
         lambda x, r: negative_binomial.nll(x, r=r, p=0.75, counts=counts),
         x
     )
+
+
+@mp.workdps(25)
+def test_mle_fixed_p_large_gaps():
+    # The gaps between some of the values in x are large enough that
+    # digamma is evaluated directly instead of using the recurrence.
+    x = [2, 3, 5, 8, 13, 150, 151, 152, 153, 300]
+    call_and_check_mle(
+        lambda x: negative_binomial.mle(x, p=0.875)[:1],
+        lambda x, r: negative_binomial.nll(x, r=r, p=0.875),
+        x
+    )
+
+
+@mp.workdps(25)
+def test_mle_integer_r_less_than_one():
+    # The unconstrained estimate of r is less than 1, so the integer
+    # estimate must be 1.
+    x = [0, 1, 2, 3, 5, 8, 13]*30 + [40, 41, 100]
+    rhat, phat = negative_binomial.mle(x, allow_noninteger_r=False)
+    assert rhat == 1
+    assert mp.almosteq(phat, mp.fsum(x)/(len(x) + mp.fsum(x)))
@@ -25,3 +25,27 @@ def test_cdf_hypergeom_relation(k, ntotal, ngood, untilnbad):
     cdf = negative_hypergeometric.cdf(k, ntotal, ngood, untilnbad)
     val = 1 - hypergeometric.cdf(hg_k, ntotal, hg_ngood, hg_nsample)
     assert mp.almosteq(cdf, val)
+
+
+@pytest.mark.parametrize('ntotal, ngood, untilnbad',
+                         [(20, 10, 8), (44, 23, 19), (10, 4, 0),
+                          (300, 120, 90)])
+@mp.workdps(40)
+def test_support_pmf(ntotal, ngood, untilnbad):
+    sup, p = negative_hypergeometric.support_pmf(ntotal, ngood, untilnbad)
+    assert sup == negative_hypergeometric.support(ntotal, ngood, untilnbad)
+    for k, pk in zip(sup, p):
+        expected = negative_hypergeometric.pmf(k, ntotal, ngood, untilnbad)
+        assert mp.almosteq(pk, expected)
+    assert mp.almosteq(mp.fsum(p), 1)
+
+
+@pytest.mark.parametrize('dps', [20, 50])
+def test_logpmf(dps):
+    ntotal, ngood, untilnbad = 44, 23, 19
+    with mp.workdps(dps):
+        for k in negative_hypergeometric.support(ntotal, ngood, untilnbad):
+            logp = negative_hypergeometric.logpmf(k, ntotal, ngood,
+                                                  untilnbad)
+            p = negative_hypergeometric.pmf(k, ntotal, ngood, untilnbad)
+            assert mp.almosteq(logp, mp.log(p))
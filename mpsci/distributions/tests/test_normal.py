@@ -51,6 +51,16 @@ def test_sf(x, sf):
         assert mp.almosteq(x2, x)
 
 
+@pytest.mark.parametrize('p', ['1e-10', '1e-40', '1e-200'])
+@mp.workdps(15)
+def test_invcdf_invsf_small_p(p):
+    p = mp.mpf(p)
+    x = normal.invcdf(p)
+    assert mp.almosteq(normal.cdf(x), p)
+    x = normal.invsf(p)
+    assert mp.almosteq(normal.sf(x), p)
+
+
 def test_entropy():
     with mp.workdps(50):
         mu = 1.5
@@ -68,3 +78,22 @@ def test_entropy():
 @mp.workdps(50)
 def test_mle(x):
     call_and_check_mle(normal.mle, normal.nll, x)
+
+
+@mp.workdps(15)
+def test_mle_cancellation():
+    # The large values cancel in the sum; the small ones must not be lost.
+    x = [1e25, 0.25, 0.5, -1e25]
+    mu, sigma = normal.mle(x)
+    assert mu == mp.mpf(0.1875)
+    assert mp.almosteq(sigma, mp.mpf(1e25)/mp.sqrt(2))
+
+
+@mp.workdps(50)
+def test_nll():
+    x = [-3, 0.5, 1.25, 2, 8.5]
+    mu = 1.5
+    sigma = 2.5
+    nll = normal.nll(x, mu, sigma)
+    expected = -mp.fsum([normal.logpdf(t, mu, sigma) for t in x])
+    assert mp.almosteq(nll, expected)